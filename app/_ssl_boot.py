@@ -0,0 +1,11 @@
+"""Point SSL and requests at the certifi CA bundle
+
+Import this before anything that opens network connections. The bundle path
+is resolved once per process, and existing settings are left untouched.
+"""
+import os
+import certifi
+
+_CA = certifi.where()
+os.environ.setdefault('SSL_CERT_FILE', _CA)
+os.environ.setdefault('REQUESTS_CA_BUNDLE', _CA)
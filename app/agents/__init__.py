@@ -1,13 +1,33 @@
-"""Agents package initialization"""
-from .base_agent import BaseAgent
-from .persona_agent import PersonaAgent
-from .competitor_agent import CompetitorAgent
-from .planner_agent import PlannerAgent
-from .creative_agent import CreativeAgent
-from .performance_agent import PerformanceAgent
-from .critic_agent import CriticAgent
-from .location_agent import LocationAgent
-from .rag_agent import RAGAgent
+"""Agents package initialization
+
+Agent classes are imported on first access (PEP 562), so importing the
+package does not pull in every agent's dependencies up front.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent
+    from .persona_agent import PersonaAgent
+    from .competitor_agent import CompetitorAgent
+    from .planner_agent import PlannerAgent
+    from .creative_agent import CreativeAgent
+    from .performance_agent import PerformanceAgent
+    from .critic_agent import CriticAgent
+    from .location_agent import LocationAgent
+    from .rag_agent import RAGAgent
+
+_LAZY_IMPORTS = {
+    "BaseAgent": ".base_agent",
+    "PersonaAgent": ".persona_agent",
+    "CompetitorAgent": ".competitor_agent",
+    "PlannerAgent": ".planner_agent",
+    "CreativeAgent": ".creative_agent",
+    "PerformanceAgent": ".performance_agent",
+    "CriticAgent": ".critic_agent",
+    "LocationAgent": ".location_agent",
+    "RAGAgent": ".rag_agent",
+}
 
 __all__ = [
     "BaseAgent",
@@ -20,3 +40,17 @@ __all__ = [
     "LocationAgent",
     "RAGAgent",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
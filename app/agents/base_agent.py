@@ -1,17 +1,27 @@
 """Base Agent using Google ADK (Agent Development Kit)"""
+import asyncio
 import json
 import os
+import re
 import ssl
 import subprocess
-from typing import Dict, Any, Optional
-import certifi
+import uuid
+from functools import lru_cache
+from typing import Dict, Any, Optional, get_args
 from google.adk.agents import Agent
+from google.adk.models import Gemini
 from google.adk.runners import InMemoryRunner
 from google.genai import types
+from pydantic import BaseModel
 
-# Configure SSL to use certifi certificates
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Configure SSL to use certifi certificates, keeping any user-provided bundle
+from .. import _ssl_boot  # noqa: F401
 
 # Configure google-genai to use Vertex AI with ADC
 def _configure_vertex_ai():
@@ -39,6 +49,73 @@ def _configure_vertex_ai():
 _configure_vertex_ai()
 
 
+def _orjson_loads(text: str) -> Any:
+    """orjson.loads with a json.loads retry for NaN/Infinity tokens
+
+    orjson rejects those non-standard tokens, which json.loads accepts, so a
+    failed parse is retried before the caller's repair path runs.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+# Both parsers raise json.JSONDecodeError, so the handlers below cover either
+_json_loads = _orjson_loads if ORJSON_AVAILABLE else json.loads
+
+# Trailing commas before a closing brace/bracket (common LLM JSON error)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+
+def _init_llm_cache():
+    """Opt-in response cache for repeated prompts (LLM_CACHE=1)
+
+    Off by default so live runs always reach the model. The cache module is
+    only imported when enabled, so agents don't load app.memory otherwise.
+    """
+    if os.getenv("LLM_CACHE") != "1":
+        return None
+    from ..memory.llm_cache import LLMCache
+    return LLMCache(os.getenv("LLM_CACHE_PATH", "llm_cache.db"))
+
+
+_LLM_CACHE = _init_llm_cache()
+
+
+def _contains_model(annotation) -> bool:
+    """Whether a field annotation refers to a nested pydantic model"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in get_args(annotation))
+
+
+@lru_cache(maxsize=None)
+def _is_flat_model(model_cls: type) -> bool:
+    """Whether model_dump() of this class is just a copy of its field values"""
+    decorators = model_cls.__pydantic_decorators__
+    return (
+        model_cls.model_config.get('alias_generator') is None
+        and model_cls.model_config.get('extra') != 'allow'
+        and not model_cls.model_computed_fields
+        and not decorators.field_serializers
+        and not decorators.model_serializers
+        and all(
+            field.alias is None
+            and field.serialization_alias is None
+            and not field.exclude
+            and not _contains_model(field.annotation)
+            for field in model_cls.model_fields.values()
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_llm(model: str) -> Gemini:
+    """Shared Gemini LLM per model name, so agents reuse one lazily built genai client"""
+    return Gemini(model=model)
+
+
 class BaseAgent:
     """Base class for all agents using Google ADK
 
@@ -78,7 +155,7 @@ class BaseAgent:
         # Create ADK Agent
         self.agent = Agent(
             name=agent_name,
-            model=model,
+            model=_get_llm(model),
             description=description,
             instruction=instruction,
             tools=tools or [],
@@ -127,6 +204,22 @@ class BaseAgent:
 
         return session
 
+    @staticmethod
+    def _fast_dump(model: BaseModel) -> Dict[str, Any]:
+        """model_dump() that skips the serializer for flat models
+
+        Models without nested models, aliases, computed fields, custom
+        serializers, excluded fields or extra fields dump to their field
+        values, so those are copied straight from __dict__.
+        Anything else goes through model_dump().
+        """
+        if not _is_flat_model(type(model)):
+            return model.model_dump()
+        return {
+            key: value.copy() if isinstance(value, (list, dict)) else value
+            for key, value in model.__dict__.items()
+        }
+
     def _clean_json_response(self, response_text: str) -> str:
         """Clean JSON response from markdown code blocks and common issues"""
         response_text = response_text.strip()
@@ -143,11 +236,31 @@ class BaseAgent:
         response_text = response_text.strip()
 
         # Remove any trailing commas before closing braces/brackets (common JSON error)
-        import re
-        response_text = re.sub(r',(\s*[}\]])', r'\1', response_text)
+        response_text = _TRAILING_COMMA_RE.sub(r'\1', response_text)
 
         return response_text
 
+    async def _collect_response(
+        self,
+        user_id: str,
+        session_id: str,
+        message: types.Content
+    ) -> str:
+        """Run the agent and join the text parts of every event
+
+        Chunks are gathered in a list and joined once, instead of growing a
+        string per part, so long responses are copied a single time.
+        """
+        chunks = []
+        async for event in self.runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=message
+        ):
+            if event.content and event.content.parts:
+                chunks.extend(part.text for part in event.content.parts if part.text)
+        return "".join(chunks)
+
     async def generate_json(
         self,
         prompt: str,
@@ -156,6 +269,9 @@ class BaseAgent:
     ) -> Dict[str, Any]:
         """Generate JSON response from prompt using ADK
 
+        When LLM_CACHE=1, identical prompts to the same agent and model are
+        served from the local response cache instead of calling the model.
+
         Args:
             prompt: The prompt to send to the model
             user_id: User identifier
@@ -164,9 +280,28 @@ class BaseAgent:
         Returns:
             Parsed JSON response as dictionary
         """
+        if _LLM_CACHE is None:
+            return await self._generate_json_uncached(prompt, user_id, session_id)
+
+        cache_key = _LLM_CACHE.make_key(self.model, self.temperature, self.agent_name, prompt)
+        # sqlite calls block, so they run off the event loop
+        cached = await asyncio.to_thread(_LLM_CACHE.get, cache_key)
+        if cached is not None:
+            return cached
+
+        result = await self._generate_json_uncached(prompt, user_id, session_id)
+        await asyncio.to_thread(_LLM_CACHE.set, cache_key, result)
+        return result
+
+    async def _generate_json_uncached(
+        self,
+        prompt: str,
+        user_id: str,
+        session_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Call the model and parse its JSON response"""
         # Generate unique session ID if not provided
         if session_id is None:
-            import uuid
             session_id = f"json_{uuid.uuid4().hex[:8]}"
 
         # Ensure session exists
@@ -179,22 +314,13 @@ class BaseAgent:
         )
 
         # Run agent and collect response
-        response_text = ""
-        async for event in self.runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=message
-        ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if part.text:
-                        response_text += part.text
+        response_text = await self._collect_response(user_id, session_id, message)
 
         # Clean and parse JSON with better error handling
         cleaned_text = self._clean_json_response(response_text)
 
         try:
-            return json.loads(cleaned_text)
+            return _json_loads(cleaned_text)
         except json.JSONDecodeError as e:
             print(f"❌ JSON Parse Error in {self.agent_name}:")
             print(f"Error: {e}")
@@ -210,7 +336,7 @@ class BaseAgent:
                     json_portion = cleaned_text[start_idx:end_idx+1]
                     json_portion = self._clean_json_response(json_portion)
                     print(f"Attempting to parse extracted JSON portion...")
-                    return json.loads(json_portion)
+                    return _json_loads(json_portion)
             except:
                 pass
 
@@ -235,7 +361,6 @@ class BaseAgent:
         """
         # Generate unique session ID if not provided
         if session_id is None:
-            import uuid
             session_id = f"text_{uuid.uuid4().hex[:8]}"
 
         # Ensure session exists
@@ -248,16 +373,7 @@ class BaseAgent:
         )
 
         # Run agent and collect response
-        response_text = ""
-        async for event in self.runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=message
-        ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if part.text:
-                        response_text += part.text
+        response_text = await self._collect_response(user_id, session_id, message)
 
         return response_text.strip()
 
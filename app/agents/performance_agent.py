@@ -41,6 +41,19 @@ Return ONLY valid JSON matching the PerformanceSet schema. No other text."""
         ])
         return f"Budget: ${plan.total_budget}\nDuration: {plan.duration_weeks} weeks\nChannels:\n{channels}"
 
+    def _format_scenarios(self, scenarios: ScenarioSet) -> tuple:
+        """Format the standard, aggressive and experimental plans
+
+        Scenarios may reuse one MediaPlan object for several fields, so each
+        distinct plan is formatted once and shared.
+        """
+        plans = (scenarios.standard_plan, scenarios.aggressive_plan, scenarios.experimental_plan)
+        formatted = {}
+        for plan in plans:
+            if id(plan) not in formatted:
+                formatted[id(plan)] = self._format_plan(plan)
+        return tuple(formatted[id(plan)] for plan in plans)
+
     async def predict_performance(
         self,
         scenarios: ScenarioSet,
@@ -61,6 +74,8 @@ Return ONLY valid JSON matching the PerformanceSet schema. No other text."""
         Returns:
             PerformanceSet with predictions for all three scenarios
         """
+        standard, aggressive, experimental = self._format_scenarios(scenarios)
+
         user_prompt = f"""
 {self.SYSTEM_INSTRUCTION}
 
@@ -77,13 +92,13 @@ Target Persona:
 Media Plans:
 
 STANDARD:
-{self._format_plan(scenarios.standard_plan)}
+{standard}
 
 AGGRESSIVE:
-{self._format_plan(scenarios.aggressive_plan)}
+{aggressive}
 
 EXPERIMENTAL:
-{self._format_plan(scenarios.experimental_plan)}
+{experimental}
 
 For each plan, estimate:
 1. Total reach (people who will see the ads)
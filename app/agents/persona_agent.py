@@ -1,4 +1,8 @@
 """Persona Agent - Generates customer personas using Google ADK"""
+import asyncio
+
+from pydantic import ValidationError
+
 from .base_agent import BaseAgent
 from ..schemas import BusinessProfile, Persona
 
@@ -18,6 +22,23 @@ Given a BusinessProfile JSON, generate ONE persona with:
 
 Return ONLY valid JSON matching the Persona schema. No other text."""
 
+    # Batched variant of SYSTEM_INSTRUCTION for generate_personas. No {count}
+    # placeholder: ADK reads {name} in an agent instruction as session state
+    BATCH_INSTRUCTION = """You are PersonaAgent, a marketing persona generator.
+Given a BusinessProfile JSON, generate the requested number of distinct personas, each with:
+
+- Name (creative, specific persona name)
+- Age range
+- Interests
+- Relevant platforms
+- Creative style
+- Motivation
+
+Return ONLY valid JSON with a list of personas matching the Persona schema. No other text."""
+
+    # Upper bound on in-flight persona LLM calls, to stay within provider rate limits
+    MAX_CONCURRENCY = 3
+
     def __init__(self):
         """Initialize PersonaAgent with Google ADK"""
         super().__init__(
@@ -27,29 +48,51 @@ Return ONLY valid JSON matching the Persona schema. No other text."""
             model="gemini-2.0-flash",
             temperature=0.7
         )
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+
+        # Batched requests go through their own ADK agent, so the model sees
+        # the batch instruction instead of the single-persona one
+        self._batch_agent = BaseAgent(
+            agent_name="persona_batch_agent",
+            description="Generates several customer personas in one request",
+            instruction=self.BATCH_INSTRUCTION,
+            model=self.model,
+            temperature=self.temperature
+        )
+
+    def _format_profile(self, profile: BusinessProfile) -> str:
+        """Format the business profile block shared by persona prompts"""
+        return f"""Business Profile:
+- Name: {profile.business_name}
+- Type: {profile.business_type}
+- Location: {profile.zip_code}
+- Goal: {profile.goal}
+- Budget: ${profile.monthly_budget}/month
+- Local: {profile.is_local}
+- Competitors: {', '.join(profile.competitors)}"""
 
-    async def generate_persona(self, profile: BusinessProfile) -> Persona:
+    async def generate_persona(self, profile: BusinessProfile, variant: int = 0) -> Persona:
         """Generate a persona based on business profile
 
         Args:
             profile: BusinessProfile object
+            variant: Non-zero asks for an alternative persona; each value gives
+                a distinct prompt, so cached responses are not reused across them
 
         Returns:
             Persona object with generated persona data
         """
+        variant_note = (
+            f"\nThis is alternative persona #{variant}: target a different audience segment than the most obvious customer.\n"
+            if variant else ""
+        )
         user_prompt = f"""
 {self.SYSTEM_INSTRUCTION}
 
-Business Profile:
-- Name: {profile.business_name}
-- Type: {profile.business_type}
-- Location: {profile.zip_code}
-- Goal: {profile.goal}
-- Budget: ${profile.monthly_budget}/month
-- Local: {profile.is_local}
-- Competitors: {', '.join(profile.competitors)}
+{self._format_profile(profile)}
 
 Generate a detailed customer persona that would be interested in this business.
+{variant_note}
 
 Return JSON in this exact format:
 {{
@@ -62,7 +105,8 @@ Return JSON in this exact format:
 }}
 """
 
-        response_json = await self.generate_json(user_prompt)
+        async with self._semaphore:
+            response_json = await self.generate_json(user_prompt)
         return Persona(**response_json)
 
     async def generate_personas(self, profile: BusinessProfile, count: int = 3) -> list[Persona]:
@@ -75,9 +119,55 @@ Return JSON in this exact format:
         Returns:
             List of Persona objects
         """
-        # Generate personas concurrently for better performance
-        import asyncio
-        personas = await asyncio.gather(*[
-            self.generate_persona(profile) for _ in range(count)
-        ])
-        return list(personas)
+        if count == 1:
+            return [await self.generate_persona(profile)]
+
+        # One request for all personas shares the system prompt and saves N-1 round trips
+        user_prompt = f"""
+{self.BATCH_INSTRUCTION}
+
+{self._format_profile(profile)}
+
+Generate {count} distinct customer personas that would be interested in this business.
+Each persona should target a different audience segment.
+
+Return JSON in this exact format, with exactly {count} entries in "personas":
+{{
+    "personas": [
+        {{
+            "name": "string",
+            "age_range": "string",
+            "interests": ["string", "string"],
+            "platforms": ["string", "string"],
+            "creative_style": "string",
+            "motivation": "string"
+        }}
+    ]
+}}
+"""
+
+        async with self._semaphore:
+            response_json = await self._batch_agent.generate_json(user_prompt)
+        # Accept {"personas": [...]} as asked, a bare list, or a single persona
+        if isinstance(response_json, dict):
+            response_json = [response_json] if "name" in response_json else response_json.get("personas", [])
+        if not isinstance(response_json, list):
+            response_json = []
+
+        # Skip malformed entries; the top-up below fills the gap
+        personas = []
+        for entry in response_json:
+            if len(personas) == count:
+                break
+            try:
+                personas.append(Persona.model_validate(entry))
+            except ValidationError:
+                continue
+
+        # Top up with single-persona calls if the model returned too few
+        if len(personas) < count:
+            personas.extend(await asyncio.gather(*[
+                self.generate_persona(profile, variant=variant)
+                for variant in range(len(personas), count)
+            ]))
+        return personas
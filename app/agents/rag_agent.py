@@ -2,6 +2,7 @@
 from .base_agent import BaseAgent
 from ..memory.vector_memory import VectorMemory
 from typing import Dict, Any, List, Optional
+import asyncio
 import json
 
 
@@ -70,14 +71,10 @@ Return structured insights that help improve the current marketing plan."""
         Is Local: {business_profile.get('is_local')}
         """
 
-        # Retrieve similar profiles
-        similar_profiles = self.vector_memory.query_similar_profiles(
-            query_text, n_results=n_results
-        )
-
-        # Retrieve similar plans
-        similar_plans = self.vector_memory.query_similar_plans(
-            query_text, n_results=n_results
+        # Retrieve similar profiles and plans concurrently, off the event loop
+        similar_profiles, similar_plans = await asyncio.gather(
+            self.vector_memory.aquery_similar_profiles(query_text, n_results=n_results),
+            self.vector_memory.aquery_similar_plans(query_text, n_results=n_results)
         )
 
         return {
@@ -256,3 +253,17 @@ Return ONLY valid JSON, no markdown formatting.
                 "plans": len(similar_context.get('similar_plans', []))
             }
         }
+
+    def prefetch(self, profile: Dict[str, Any]) -> asyncio.Task:
+        """Start augment_profile_with_insights in the background
+
+        Nothing else in plan generation depends on the RAG insights, so the
+        caller can run the other agents and await the task at the end.
+
+        Args:
+            profile: Business profile to augment
+
+        Returns:
+            Task resolving to the augment_profile_with_insights result
+        """
+        return asyncio.create_task(self.augment_profile_with_insights(profile))
@@ -17,7 +17,7 @@ from ..agents import (
     CreativeAgent, PerformanceAgent, CriticAgent,
     LocationAgent, RAGAgent
 )
-from ..memory import SQLiteMemory, VectorMemory
+from ..memory import SQLiteMemory, get_vector_memory
 from ..observability import agent_logger
 from ..progress_tracker import progress_tracker, AGENT_STEPS, get_agent_step_info
 from ..utils import calculate_reach_percentage, calculate_budget_scaling
@@ -26,7 +26,7 @@ router = APIRouter()
 
 # Initialize components
 sqlite_memory = SQLiteMemory()
-vector_memory = VectorMemory()
+vector_memory = get_vector_memory()
 
 # Initialize agents
 persona_agent = PersonaAgent()
@@ -20,7 +20,7 @@ from .agents import (
     LocationAgent,
     RAGAgent
 )
-from .memory import SQLiteMemory, VectorMemory
+from .memory import SQLiteMemory, get_vector_memory
 from .observability import LoggingMiddleware, metrics_collector, agent_logger
 from .utils import PDFGenerator, calculate_reach_percentage, calculate_budget_scaling
 from .api import test_data, plan_with_progress
@@ -53,7 +53,7 @@ templates = Jinja2Templates(directory="app/templates")
 
 # Initialize memory
 sqlite_memory = SQLiteMemory()
-vector_memory = VectorMemory()
+vector_memory = get_vector_memory()
 
 # Initialize agents with Google ADK (uses ADC)
 persona_agent = PersonaAgent()
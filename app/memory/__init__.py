@@ -1,5 +1,35 @@
-"""Memory package initialization"""
-from .sqlite_memory import SQLiteMemory
-from .vector_memory import VectorMemory
+"""Memory package initialization
 
-__all__ = ["SQLiteMemory", "VectorMemory"]
+Memory classes are imported on first access (PEP 562), so importing one
+submodule, like llm_cache, does not load ChromaDB through vector_memory.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sqlite_memory import SQLiteMemory
+    from .vector_memory import VectorMemory, get_vector_memory
+    from .llm_cache import LLMCache
+
+_LAZY_IMPORTS = {
+    "SQLiteMemory": ".sqlite_memory",
+    "VectorMemory": ".vector_memory",
+    "get_vector_memory": ".vector_memory",
+    "LLMCache": ".llm_cache",
+}
+
+__all__ = ["SQLiteMemory", "VectorMemory", "LLMCache", "get_vector_memory"]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
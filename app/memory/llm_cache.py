@@ -0,0 +1,61 @@
+"""LLM Response Cache backed by SQLite"""
+import sqlite3
+import json
+import hashlib
+import time
+from contextlib import closing
+from typing import Optional, Dict, Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class LLMCache:
+    """Caches parsed JSON responses for identical LLM prompts"""
+
+    def __init__(self, db_path: str = "llm_cache.db", ttl_days: float = 7):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.init_db()
+
+    def init_db(self):
+        """Create the cache table if it does not exist"""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    response_json TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    @staticmethod
+    def make_key(model: str, temperature: float, agent_name: str, prompt: str) -> str:
+        """Hash the request parameters; whitespace in the prompt is normalized"""
+        normalized_prompt = " ".join(prompt.split())
+        payload = json.dumps([model, temperature, agent_name, normalized_prompt])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response, or None if missing or expired"""
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            cursor = conn.execute(
+                "SELECT response_json FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            )
+            result = cursor.fetchone()
+            if not result:
+                return None
+            return orjson.loads(result[0]) if ORJSON_AVAILABLE else json.loads(result[0])
+
+    def set(self, key: str, response: Dict[str, Any]):
+        """Store a parsed response"""
+        response_json = orjson.dumps(response).decode() if ORJSON_AVAILABLE else json.dumps(response)
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response_json, created_at) VALUES (?, ?, ?)",
+                (key, response_json, time.time())
+            )
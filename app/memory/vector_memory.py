@@ -7,7 +7,9 @@ except ImportError:
     CHROMADB_AVAILABLE = False
 
 from typing import List, Dict, Any, Optional
+import asyncio
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -66,16 +68,29 @@ class VectorMemory:
             ids=[f"profile_{session_id}"]
         )
 
+    @staticmethod
+    def plan_summary_metadata(plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Summary fields projected into plan metadata so readers can skip the full plan JSON"""
+        metadata = {}
+        total_budget = ((plan.get('scenarios') or {}).get('standard_plan') or {}).get('total_budget')
+        if total_budget is not None:
+            metadata["total_budget"] = total_budget
+        persona_name = (plan.get('persona') or {}).get('name')
+        if persona_name is not None:
+            metadata["persona_name"] = persona_name
+        return metadata
+
     def store_plan(self, session_id: str, plan_id: str, plan: Dict[str, Any]):
         """Store generated plan"""
         if not CHROMADB_AVAILABLE or self.plan_memory is None:
             return
 
         document = json.dumps(plan, indent=2)
+        metadata = {"session_id": session_id, "plan_id": plan_id, **self.plan_summary_metadata(plan)}
 
         self.plan_memory.add(
             documents=[document],
-            metadatas=[{"session_id": session_id, "plan_id": plan_id}],
+            metadatas=[metadata],
             ids=[f"plan_{plan_id}"]
         )
 
@@ -142,6 +157,14 @@ class VectorMemory:
             ]
         return []
 
+    async def aquery_similar_profiles(self, query_text: str, n_results: int = 5) -> List[Dict[str, Any]]:
+        """Find similar business profiles without blocking the event loop"""
+        return await asyncio.to_thread(self.query_similar_profiles, query_text, n_results)
+
+    async def aquery_similar_plans(self, query_text: str, n_results: int = 5) -> List[Dict[str, Any]]:
+        """Find similar plans without blocking the event loop"""
+        return await asyncio.to_thread(self.query_similar_plans, query_text, n_results)
+
     def get_profile_history(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get profile for a session"""
         if not CHROMADB_AVAILABLE or self.user_memory is None:
@@ -179,3 +202,17 @@ class VectorMemory:
         except:
             pass
         return {"total_feedback": 0, "avg_rating": 0, "rating_distribution": {}}
+
+
+@lru_cache(maxsize=None)
+def _shared_vector_memory(persist_directory: str) -> VectorMemory:
+    return VectorMemory(persist_directory=persist_directory)
+
+
+def get_vector_memory(persist_directory: str = "./vector_store") -> VectorMemory:
+    """Return the process-wide VectorMemory for a persist directory
+
+    Opening the Chroma client and collections is the expensive part, so
+    callers share one instance per directory instead of building their own.
+    """
+    return _shared_vector_memory(str(Path(persist_directory).resolve()))
@@ -5,9 +5,7 @@ Interactive UI for generating marketing plans
 """
 # IMPORTANT: Configure SSL certificates BEFORE any other imports
 import os
-import certifi
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+import app._ssl_boot  # noqa: F401
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'  # Suppress tokenizer warnings
 
 import streamlit as st
@@ -26,7 +24,7 @@ from app.agents import (
     PlannerAgent, CreativeAgent, PerformanceAgent,
     CriticAgent, RAGAgent
 )
-from app.memory.vector_memory import VectorMemory
+from app.memory.vector_memory import get_vector_memory
 
 # Page configuration
 st.set_page_config(
@@ -88,7 +86,7 @@ if 'example_profile' not in st.session_state:
 
 def initialize_agents():
     """Initialize all agents"""
-    vector_memory = VectorMemory(persist_directory="./vector_store")
+    vector_memory = get_vector_memory("./vector_store")
 
     return {
         'rag': RAGAgent(vector_memory),
@@ -104,65 +102,78 @@ def initialize_agents():
 
 
 async def generate_plan_async(profile: BusinessProfile, agents: dict, progress_bar, status_text):
-    """Generate marketing plan with progress updates"""
+    """Generate marketing plan with progress updates
+
+    RAG insights are only reported, never fed to the other agents, so the
+    lookup runs in the background for the whole pipeline.
+    """
 
     start_time = time.time()
 
-    # Step 0: RAG
+    # Step 0: RAG (in the background)
     status_text.text("🔍 Retrieving historical insights from vector database...")
     progress_bar.progress(10)
-    rag_augmented = await agents['rag'].augment_profile_with_insights(profile.model_dump())
-    rag_insights = rag_augmented.get('rag_insights', {})
+    rag_task = agents['rag'].prefetch(profile.model_dump())
+
+    try:
+        # Step 1: Personas
+        status_text.text("👥 Generating customer personas...")
+        progress_bar.progress(20)
+        personas = await agents['persona'].generate_personas(profile)
+
+        # Step 2: Location
+        status_text.text("📍 Analyzing location demographics...")
+        progress_bar.progress(30)
+        location_analysis = await agents['location'].analyze_location(profile)
+
+        # Step 3: Competitors
+        status_text.text("🏆 Researching competitors...")
+        progress_bar.progress(40)
+        competitor_analysis = await agents['competitor'].analyze_competitors(
+            profile.competitors if profile.competitors else ["Generic Competitor"],
+            profile.business_type,
+            profile.location
+        )
 
-    # Step 1: Personas
-    status_text.text("👥 Generating customer personas...")
-    progress_bar.progress(20)
-    personas = await agents['persona'].generate_personas(profile)
-
-    # Step 2: Location
-    status_text.text("📍 Analyzing location demographics...")
-    progress_bar.progress(30)
-    location_analysis = await agents['location'].analyze_location(profile)
-
-    # Step 3: Competitors
-    status_text.text("🏆 Researching competitors...")
-    progress_bar.progress(40)
-    competitor_analysis = await agents['competitor'].analyze_competitors(
-        profile.competitors if profile.competitors else ["Generic Competitor"],
-        profile.business_type,
-        profile.location
-    )
+        # Step 4: Budget Scenarios
+        status_text.text("💰 Creating budget scenarios...")
+        progress_bar.progress(55)
+        scenarios = await agents['planner'].generate_scenarios(
+            profile, personas[0], competitor_analysis
+        )
 
-    # Step 4: Budget Scenarios
-    status_text.text("💰 Creating budget scenarios...")
-    progress_bar.progress(55)
-    scenarios = await agents['planner'].generate_scenarios(
-        profile, personas[0], competitor_analysis
-    )
+        # Step 5: Creative Assets
+        status_text.text("🎨 Generating creative assets...")
+        progress_bar.progress(70)
+        creative_assets = await agents['creative'].generate_assets(profile, personas[0])
 
-    # Step 5: Creative Assets
-    status_text.text("🎨 Generating creative assets...")
-    progress_bar.progress(70)
-    creative_assets = await agents['creative'].generate_assets(profile, personas[0])
+        # Step 6: Performance Predictions
+        status_text.text("📈 Predicting performance metrics...")
+        progress_bar.progress(85)
+        performance = await agents['performance'].predict_performance(
+            scenarios, personas[0], profile.business_type, profile.location, profile.is_local
+        )
 
-    # Step 6: Performance Predictions
-    status_text.text("📈 Predicting performance metrics...")
-    progress_bar.progress(85)
-    performance = await agents['performance'].predict_performance(
-        scenarios, personas[0], profile.business_type, profile.location, profile.is_local
-    )
+        # Step 7: Evaluation
+        status_text.text("✅ Evaluating plan quality...")
+        progress_bar.progress(95)
+
+        evaluation = await agents['critic'].evaluate_plan(
+            scenarios=scenarios,
+            persona=personas[0],
+            competitor_snapshot=competitor_analysis,
+            creatives=creative_assets,
+            business_goal=profile.goal
+        )
 
-    # Step 7: Evaluation
-    status_text.text("✅ Evaluating plan quality...")
-    progress_bar.progress(95)
+        rag_augmented = await rag_task
+    except BaseException:
+        # Don't leave the background lookup running or its error unretrieved
+        rag_task.cancel()
+        await asyncio.gather(rag_task, return_exceptions=True)
+        raise
 
-    evaluation = await agents['critic'].evaluate_plan(
-        scenarios=scenarios,
-        persona=personas[0],
-        competitor_snapshot=competitor_analysis,
-        creatives=creative_assets,
-        business_goal=profile.goal
-    )
+    rag_insights = rag_augmented.get('rag_insights', {})
 
     # Build full plan for return
     full_plan = {
@@ -197,7 +208,7 @@ async def generate_plan_async(profile: BusinessProfile, agents: dict, progress_b
 
 def render_header():
     """Render page header"""
-    st.markdown('<h1 class="main-header">🎯 Smart Ad Planner</h1>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header" data-testid="app-header">🎯 Smart Ad Planner</h1>', unsafe_allow_html=True)
     st.markdown(
         '<p class="sub-header">AI-Powered Marketing Plans in 45 Seconds | 7 Specialized Agents | Enterprise-Grade</p>',
         unsafe_allow_html=True
@@ -832,9 +843,9 @@ def main():
     # Footer
     st.markdown("---")
     st.markdown("""
-    <div style='text-align: center; color: #666;'>
+    <div data-testid='app-footer' style='text-align: center; color: #666;'>
         <p>Built with ❤️ using Google ADK, Gemini 2.0 Flash, ChromaDB, and Streamlit</p>
-        <p>Smart Ad Planner • <a href='https://github.com/amitjava/ad_planner_ai'>GitHub</a> • Kaggle AI Agents Intensive - Enterprise Category</p>
+        <p>Smart Ad Planner • <a data-testid='github-link' href='https://github.com/amitjava/ad_planner_ai'>GitHub</a> • Kaggle AI Agents Intensive - Enterprise Category</p>
     </div>
     """, unsafe_allow_html=True)
 
@@ -4,16 +4,65 @@ Backfill existing plans from SQLite to ChromaDB Vector Store
 """
 import sqlite3
 import json
+import hashlib
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.insert(0, '.')
 
 from app.memory.vector_memory import VectorMemory
 
+# Chroma embedding work releases the GIL, so plans are stored in parallel
+MAX_WORKERS = 8
+
+# Progress lines are buffered and written to stdout every N plans
+PROGRESS_FLUSH_EVERY = 64
+
+# "2025-11-15 22:04:36" -> "20251115220436" in a single pass
+_TS_TRANS = str.maketrans({'-': '', ':': '', ' ': ''})
+
+
+def _flush_progress(buffer):
+    """Write buffered progress lines to stdout in one call"""
+    if buffer:
+        sys.stdout.write("\n".join(buffer) + "\n")
+        sys.stdout.flush()
+        buffer.clear()
+
+
+def _backfill_plan(vector_memory, session_id, plan_doc_id, profile, plan, store_profile=True):
+    """Store a single plan (and optionally its profile) in the vector DB"""
+    # Store business profile
+    if store_profile:
+        vector_memory.store_business_profile(session_id, profile)
+
+    # Store plan
+    vector_memory.store_plan(session_id, plan_doc_id, plan)
+
+    return profile
+
+
 def backfill():
     """Backfill all existing plans from SQLite to Vector DB"""
 
     # Connect to SQLite
     conn = sqlite3.connect('ad_planner.db')
+
+    # Tune SQLite for a fast sequential scan (64MB page cache, 256MB mmap)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+    # One-time DDL: lets the ORDER BY below walk the index instead of building
+    # a temp B-tree (EXPLAIN QUERY PLAN: "SCAN p USING INDEX idx_plans_created_at")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_plans_created_at ON plans(created_at)")
+    conn.commit()
+
+    # The scan below never writes, so lock the file for this reader alone
+    conn.execute("PRAGMA query_only=1")
+    conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+
     cursor = conn.cursor()
 
     # Initialize Vector Memory
@@ -23,7 +72,8 @@ def backfill():
     print("  BACKFILLING PLANS TO VECTOR DATABASE")
     print("=" * 60)
 
-    # Get all plans
+    # Get all plans inside a single read transaction
+    cursor.execute("BEGIN")
     cursor.execute('''
         SELECT p.id, u.session_id, p.profile_json, p.plan_json, p.created_at
         FROM plans p
@@ -32,37 +82,96 @@ def backfill():
     ''')
 
     plans = cursor.fetchall()
+    conn.commit()
     total_plans = len(plans)
 
     print(f"\nFound {total_plans} plans to backfill\n")
 
+    # Plans already in the vector DB are skipped so re-runs don't re-embed them;
+    # their metadata is still topped up with summary fields added since
+    existing_metadata = {}
+    if vector_memory.plan_memory:
+        existing = vector_memory.plan_memory.get(include=['metadatas'])
+        existing_metadata = dict(zip(existing['ids'], existing['metadatas']))
+    metadata_updates = {}
+
     success_count = 0
     error_count = 0
-
-    for i, (plan_id, session_id, profile_json, plan_json, created_at) in enumerate(plans, 1):
-        try:
-            profile = json.loads(profile_json)
-            plan = json.loads(plan_json)
-
-            # Store business profile
-            vector_memory.store_business_profile(session_id, profile)
-
-            # Store plan
-            plan_doc_id = f"plan_{session_id}_{int(created_at.replace('-', '').replace(':', '').replace(' ', '_'))}"
-            vector_memory.store_plan(session_id, plan_doc_id, plan)
-
-            print(f"[{i}/{total_plans}] ✓ Backfilled: {profile.get('business_name')} ({profile.get('business_type')})")
-            success_count += 1
-
-        except Exception as e:
-            print(f"[{i}/{total_plans}] ✗ Error: {e}")
-            error_count += 1
+    skipped_count = 0
+    updated_count = 0
+    done_count = 0
+    progress = []
+
+    # Profiles rarely change between a session's plans; embed each distinct one once
+    seen_profiles = set()
+
+    # SQLite rows are parsed on the main thread; only vector DB writes are offloaded.
+    # Results are collected on the main thread too, so the counters need no lock.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        for plan_id, session_id, profile_json, plan_json, created_at in plans:
+            plan_doc_id = f"plan_{session_id}_{created_at.translate(_TS_TRANS)}"
+            # store_plan prefixes the document ID with "plan_"
+            doc_id = f"plan_{plan_doc_id}"
+            if doc_id in existing_metadata:
+                done_count += 1
+                skipped_count += 1
+                metadata = existing_metadata[doc_id] or {}
+                if not {"total_budget", "persona_name"} <= metadata.keys():
+                    try:
+                        summary = VectorMemory.plan_summary_metadata(json.loads(plan_json))
+                    except Exception:
+                        summary = {}
+                    if summary.keys() - metadata.keys():
+                        metadata_updates[doc_id] = {**metadata, **summary}
+                continue
+
+            try:
+                profile = json.loads(profile_json)
+                plan = json.loads(plan_json)
+            except Exception as e:
+                done_count += 1
+                error_count += 1
+                progress.append(f"[{done_count}/{total_plans}] ✗ Error: {e}")
+                continue
+
+            profile_key = (session_id, hashlib.blake2b(profile_json.encode(), digest_size=8).digest())
+            store_profile = profile_key not in seen_profiles
+            seen_profiles.add(profile_key)
+
+            futures.append(executor.submit(
+                _backfill_plan, vector_memory, session_id, plan_doc_id, profile, plan, store_profile
+            ))
+
+        for future in as_completed(futures):
+            try:
+                profile = future.result()
+                done_count += 1
+                success_count += 1
+                progress.append(f"[{done_count}/{total_plans}] ✓ Backfilled: {profile.get('business_name')} ({profile.get('business_type')})")
+            except Exception as e:
+                done_count += 1
+                error_count += 1
+                progress.append(f"[{done_count}/{total_plans}] ✗ Error: {e}")
+
+            if len(progress) >= PROGRESS_FLUSH_EVERY:
+                _flush_progress(progress)
+
+    _flush_progress(progress)
+
+    # Existing plans stored before their summary fields were projected
+    if metadata_updates:
+        vector_memory.plan_memory.update(
+            ids=list(metadata_updates),
+            metadatas=list(metadata_updates.values())
+        )
+        updated_count = len(metadata_updates)
 
     conn.close()
 
     print("\n" + "=" * 60)
     print(f"  BACKFILL COMPLETE")
-    print(f"  Success: {success_count} | Errors: {error_count}")
+    print(f"  Success: {success_count} | Skipped: {skipped_count} | Metadata updated: {updated_count} | Errors: {error_count}")
     print("=" * 60)
 
     # Verify the backfill
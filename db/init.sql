@@ -33,5 +33,7 @@ CREATE TABLE IF NOT EXISTS logs (
 
 -- Indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_plans_user_id ON plans(user_id);
+CREATE INDEX IF NOT EXISTS idx_plans_created_at ON plans(created_at);
 CREATE INDEX IF NOT EXISTS idx_feedback_user_id ON feedback(user_id);
+CREATE INDEX IF NOT EXISTS idx_feedback_plan_type ON feedback(plan_type, rating);
 CREATE INDEX IF NOT EXISTS idx_logs_created_at ON logs(created_at);
@@ -17,6 +17,7 @@ from mcp.types import (
 )
 import mcp.types as types
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 # Initialize MCP server
@@ -25,6 +26,15 @@ server = Server("image-search-server")
 # SerpAPI configuration (free tier: 100 searches/month)
 SERPAPI_KEY = os.getenv("SERPAPI_KEY", "")
 
+# Shared HTTP session so SerpAPI calls reuse pooled TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.headers.update({"Connection": "keep-alive"})
+
+# Unsplash Source URL templates used by the fallback
+_THUMB_TPL = "https://source.unsplash.com/400x300/?{kw}&sig={i}"
+_ORIG_TPL = "https://source.unsplash.com/800x600/?{kw}&sig={i}"
+
 
 @server.list_tools()
 async def handle_list_tools() -> list[Tool]:
@@ -98,7 +108,7 @@ async def search_images(query: str, num_results: int = 3) -> dict[str, Any]:
 
     # If no API key, use fallback Unsplash images
     if not SERPAPI_KEY:
-        return await search_unsplash_fallback(query, num_results)
+        return search_unsplash_fallback(query, num_results)
 
     try:
         # Call SerpAPI
@@ -110,7 +120,7 @@ async def search_images(query: str, num_results: int = 3) -> dict[str, Any]:
             "safe": "active",  # Safe search
         }
 
-        response = requests.get("https://serpapi.com/search", params=params, timeout=10)
+        response = _SESSION.get("https://serpapi.com/search", params=params, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -136,10 +146,10 @@ async def search_images(query: str, num_results: int = 3) -> dict[str, Any]:
 
     except Exception as e:
         # Fallback to Unsplash if SerpAPI fails
-        return await search_unsplash_fallback(query, num_results)
+        return search_unsplash_fallback(query, num_results)
 
 
-async def search_unsplash_fallback(query: str, num_results: int = 3) -> dict[str, Any]:
+def search_unsplash_fallback(query: str, num_results: int = 3) -> dict[str, Any]:
     """
     Fallback: Use Unsplash Source API (no key required)
     Returns random relevant images based on query keywords
@@ -151,18 +161,17 @@ async def search_unsplash_fallback(query: str, num_results: int = 3) -> dict[str
 
     # Unsplash provides random images by keyword
     images = []
+    title = f"Image for: {query}"
     for i in range(min(num_results, 3)):
-        # Different sizes for variety
-        width = 800
-        height = 600
+        original = _ORIG_TPL.format(kw=keywords, i=i)
 
         images.append({
             "position": i + 1,
-            "title": f"Image for: {query}",
-            "thumbnail": f"https://source.unsplash.com/400x300/?{keywords}&sig={i}",
-            "original": f"https://source.unsplash.com/{width}x{height}/?{keywords}&sig={i}",
+            "title": title,
+            "thumbnail": _THUMB_TPL.format(kw=keywords, i=i),
+            "original": original,
             "source": "Unsplash",
-            "link": f"https://source.unsplash.com/{width}x{height}/?{keywords}&sig={i}",
+            "link": original,
         })
 
     return {
@@ -4,7 +4,7 @@ ChromaDB Query Examples - Understanding Vector Database Queries
 Unlike SQL which uses exact matches, ChromaDB uses semantic similarity
 """
 import chromadb
-import json
+import numpy as np
 
 # Connect to the database
 client = chromadb.PersistentClient(path='./vector_store')
@@ -21,7 +21,7 @@ print("\n📚 EXAMPLE 1: Get All Documents (like SELECT * FROM table)")
 print("-"*70)
 print("SQL equivalent: SELECT * FROM plan_memory LIMIT 3;\n")
 
-results = plan_memory.get(limit=3, include=['documents', 'metadatas'])
+results = plan_memory.get(limit=3, include=['metadatas'])
 
 for i, (doc_id, meta) in enumerate(zip(results['ids'], results['metadatas']), 1):
     print(f"{i}. ID: {doc_id[:40]}...")
@@ -59,20 +59,40 @@ print("\n📚 EXAMPLE 4: Semantic Search (UNIQUE TO VECTOR DB - No SQL equivalen
 print("-"*70)
 print("This is where vector databases shine - finding similar content by meaning\n")
 
-# Query 1: Coffee shop
-print("Query 1: 'Coffee shop in Portland with morning rush hour focus'")
-results = user_memory.query(
-    query_texts=["Coffee shop in Portland with morning rush hour focus"],
+# Batch the demo queries per collection so each is embedded in a single call
+profile_queries = [
+    "Coffee shop in Portland with morning rush hour focus",
+    "Yoga studio targeting health-conscious professionals",
+]
+plan_queries = [
+    "Small business with $2500 monthly budget",
+    "local marketing strategy for small business",
+]
+
+profile_results = user_memory.query(
+    query_texts=profile_queries,
     n_results=3,
     include=['documents', 'metadatas', 'distances']
 )
+# Budget and persona are stored as plan metadata, so the plan JSON isn't fetched
+plan_results = plan_memory.query(
+    query_texts=plan_queries,
+    n_results=3,
+    include=['metadatas', 'distances']
+)
+
+# Convert distances to similarity percentages in one vectorized step per collection
+profile_sims = (1 - np.asarray(profile_results['distances'], dtype=np.float64)) * 100.0
+plan_sims = (1 - np.asarray(plan_results['distances'], dtype=np.float64)) * 100.0
+
+# Query 1: Coffee shop
+print(f"Query 1: '{profile_queries[0]}'")
 
-for i, (doc, meta, dist) in enumerate(zip(
-    results['documents'][0],
-    results['metadatas'][0],
-    results['distances'][0]
+for i, (doc, meta, similarity) in enumerate(zip(
+    profile_results['documents'][0],
+    profile_results['metadatas'][0],
+    profile_sims[0]
 ), 1):
-    similarity = (1 - dist) * 100
     print(f"\n  [{i}] Similarity: {similarity:.1f}%")
     print(f"      Session: {meta['session_id'][:20]}...")
     lines = [l.strip() for l in doc.split('\n') if l.strip()][:3]
@@ -82,37 +102,23 @@ for i, (doc, meta, dist) in enumerate(zip(
 print("\n" + "-"*70)
 
 # Query 2: Yoga studio
-print("\nQuery 2: 'Yoga studio targeting health-conscious professionals'")
-results = user_memory.query(
-    query_texts=["Yoga studio targeting health-conscious professionals"],
-    n_results=2,
-    include=['distances']
-)
+print(f"\nQuery 2: '{profile_queries[1]}'")
 
-for i, dist in enumerate(results['distances'][0], 1):
-    similarity = (1 - dist) * 100
+for i, similarity in enumerate(profile_sims[1][:2], 1):
     print(f"  [{i}] Similarity: {similarity:.1f}%")
 
 print("\n" + "-"*70)
 
 # Query 3: Budget-focused
-print("\nQuery 3: 'Small business with $2500 monthly budget'")
-results = plan_memory.query(
-    query_texts=["Small business with $2500 monthly budget"],
-    n_results=3,
-    include=['documents', 'distances']
-)
+print(f"\nQuery 3: '{plan_queries[0]}'")
 
-for i, (doc, dist) in enumerate(zip(results['documents'][0], results['distances'][0]), 1):
-    try:
-        plan = json.loads(doc)
-        budget = plan.get('scenarios', {}).get('standard_plan', {}).get('total_budget', 'N/A')
-        persona = plan.get('persona', {}).get('name', 'N/A')
-        similarity = (1 - dist) * 100
+# total_budget/persona_name are written by store_plan; run backfill_vector_db.py
+# to add them to plans stored before they existed
+for i, (meta, similarity) in enumerate(zip(plan_results['metadatas'][0], plan_sims[0]), 1):
+    budget = meta.get('total_budget', 'N/A')
+    persona = meta.get('persona_name', 'N/A')
 
-        print(f"  [{i}] Similarity: {similarity:.1f}% | Budget: ${budget} | Persona: {persona}")
-    except:
-        pass
+    print(f"  [{i}] Similarity: {similarity:.1f}% | Budget: ${budget} | Persona: {persona}")
 
 print("\n📚 EXAMPLE 5: Count Documents (like SELECT COUNT(*) FROM table)")
 print("-"*70)
@@ -124,18 +130,11 @@ print("\n📚 EXAMPLE 6: Complex Query with Filters + Semantic Search")
 print("-"*70)
 print("Find plans similar to 'local marketing' with specific metadata\n")
 
-# Note: ChromaDB supports combining semantic search with metadata filters
-results = plan_memory.query(
-    query_texts=["local marketing strategy for small business"],
-    n_results=3,
-    include=['documents', 'distances']
-    # You can add metadata filters here
-    # where={"session_id": {"$ne": "some_id"}}  # Not equal
-)
-
-print(f"Found {len(results['documents'][0])} similar plans")
-for i, dist in enumerate(results['distances'][0], 1):
-    similarity = (1 - dist) * 100
+# Note: ChromaDB supports combining semantic search with metadata filters, e.g.
+#   plan_memory.query(query_texts=[...], where={"session_id": {"$ne": "some_id"}})
+# This query was batched with Query 3 above.
+print(f"Found {len(plan_results['ids'][1])} similar plans")
+for i, similarity in enumerate(plan_sims[1], 1):
     print(f"  [{i}] Similarity: {similarity:.1f}%")
 
 print("\n" + "="*70)
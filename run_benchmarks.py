@@ -2,359 +2,491 @@
 """
 Smart Ad Planner - Benchmark Suite
 Generates 20 test plans and collects performance metrics
+
+Usage:
+    python run_benchmarks.py                            # run all profiles
+    python run_benchmarks.py --shards 4 --shard-id 0    # run one of 4 shards
+    python run_benchmarks.py --aggregate                # report on all shards
 """
+import argparse
 import asyncio
+import glob
 import json
 import time
 import sys
 import os
 from datetime import datetime
-from typing import List, Dict, Any
-from statistics import mean, median, stdev
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from operator import itemgetter
+from pathlib import Path
+from collections import defaultdict
+from statistics import fmean
+
+import numpy as np
+from jinja2 import Environment, FileSystemLoader
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# uvloop is POSIX-only; Windows keeps the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
 # Add app directory to path
 sys.path.insert(0, '.')
 
 from app.schemas import BusinessProfile
-from app.agents import (
-    PersonaAgent, LocationAgent, CompetitorAgent,
-    PlannerAgent, CreativeAgent, PerformanceAgent,
-    CriticAgent, RAGAgent
-)
-from app.memory.vector_memory import VectorMemory
+
+
+@dataclass(slots=True, frozen=True)
+class TestProfile:
+    """Immutable benchmark input, converted to a BusinessProfile once at import"""
+    business_name: str
+    business_type: str
+    location: str
+    zip_code: str
+    miles_radius: int
+    goal: str
+    monthly_budget: float
+    duration_weeks: int
+    competitors: Tuple[str, ...]
+    is_local: bool
 
 
 # Test business profiles
-TEST_PROFILES = [
-    {
-        "business_name": "Joe's Coffee Shop",
-        "business_type": "Coffee Shop",
-        "location": "San Francisco, CA",
-        "zip_code": "94107",
-        "miles_radius": 3,
-        "goal": "Increase weekday lunchtime traffic by 20%",
-        "monthly_budget": 2500,
-        "duration_weeks": 10,
-        "competitors": ["Starbucks", "Blue Bottle Coffee"],
-        "is_local": True
-    },
-    {
-        "business_name": "Yoga Flow Studio",
-        "business_type": "Yoga Studio",
-        "location": "Portland, OR",
-        "zip_code": "97201",
-        "miles_radius": 5,
-        "goal": "Grow membership by 30% in 3 months",
-        "monthly_budget": 3500,
-        "duration_weeks": 12,
-        "competitors": ["CorePower Yoga", "Modo Yoga"],
-        "is_local": True
-    },
-    {
-        "business_name": "Bella's Boutique",
-        "business_type": "Boutique",
-        "location": "Austin, TX",
-        "zip_code": "78701",
-        "miles_radius": 10,
-        "goal": "Drive online and in-store sales for spring collection",
-        "monthly_budget": 4000,
-        "duration_weeks": 8,
-        "competitors": ["Zara", "Free People"],
-        "is_local": True
-    },
-    {
-        "business_name": "TechStart SaaS",
-        "business_type": "B2B SaaS",
-        "location": "New York, NY",
-        "zip_code": "10001",
-        "miles_radius": 50,
-        "goal": "Generate 500 qualified leads for enterprise product",
-        "monthly_budget": 10000,
-        "duration_weeks": 12,
-        "competitors": ["Salesforce", "HubSpot"],
-        "is_local": False
-    },
-    {
-        "business_name": "Fitness First Gym",
-        "business_type": "Fitness Studio",
-        "location": "Miami, FL",
-        "zip_code": "33101",
-        "miles_radius": 7,
-        "goal": "Increase gym memberships by 25% before summer",
-        "monthly_budget": 3000,
-        "duration_weeks": 10,
-        "competitors": ["Planet Fitness", "Equinox"],
-        "is_local": True
-    },
-    {
-        "business_name": "The Local Bakery",
-        "business_type": "Bakery",
-        "location": "Seattle, WA",
-        "zip_code": "98101",
-        "miles_radius": 4,
-        "goal": "Boost weekend sales and catering orders",
-        "monthly_budget": 2000,
-        "duration_weeks": 8,
-        "competitors": ["Starbucks", "Whole Foods"],
-        "is_local": True
-    },
-    {
-        "business_name": "Urban Salon & Spa",
-        "business_type": "Salon/Spa",
-        "location": "Los Angeles, CA",
-        "zip_code": "90001",
-        "miles_radius": 5,
-        "goal": "Fill appointment slots and promote new services",
-        "monthly_budget": 2800,
-        "duration_weeks": 12,
-        "competitors": ["Drybar", "Burke Williams"],
-        "is_local": True
-    },
-    {
-        "business_name": "Prime Real Estate",
-        "business_type": "Local Service Business",
-        "location": "Chicago, IL",
-        "zip_code": "60601",
-        "miles_radius": 15,
-        "goal": "Generate seller and buyer leads in luxury market",
-        "monthly_budget": 5000,
-        "duration_weeks": 12,
-        "competitors": ["Compass", "Keller Williams"],
-        "is_local": True
-    },
-    {
-        "business_name": "Eco Clean Services",
-        "business_type": "Local Service Business",
-        "location": "Denver, CO",
-        "zip_code": "80201",
-        "miles_radius": 20,
-        "goal": "Acquire 100 recurring residential cleaning clients",
-        "monthly_budget": 1500,
-        "duration_weeks": 8,
-        "competitors": ["MaidPro", "Molly Maid"],
-        "is_local": True
-    },
-    {
-        "business_name": "Artisan Pizza Co",
-        "business_type": "Restaurant",
-        "location": "Boston, MA",
-        "zip_code": "02101",
-        "miles_radius": 3,
-        "goal": "Increase dinner reservations and delivery orders",
-        "monthly_budget": 3200,
-        "duration_weeks": 10,
-        "competitors": ["Domino's", "Papa Gino's"],
-        "is_local": True
-    },
-    {
-        "business_name": "Pet Paradise Grooming",
-        "business_type": "Local Service Business",
-        "location": "Phoenix, AZ",
-        "zip_code": "85001",
-        "miles_radius": 10,
-        "goal": "Build clientele for new location",
-        "monthly_budget": 2500,
-        "duration_weeks": 12,
-        "competitors": ["PetSmart", "Petco"],
-        "is_local": True
-    },
-    {
-        "business_name": "CloudTech Solutions",
-        "business_type": "B2B SaaS",
-        "location": "San Jose, CA",
-        "zip_code": "95101",
-        "miles_radius": 50,
-        "goal": "Generate demo requests for cloud migration tool",
-        "monthly_budget": 8000,
-        "duration_weeks": 12,
-        "competitors": ["AWS", "Azure"],
-        "is_local": False
-    },
-    {
-        "business_name": "Green Thumb Nursery",
-        "business_type": "Retail Store",
-        "location": "Nashville, TN",
-        "zip_code": "37201",
-        "miles_radius": 8,
-        "goal": "Drive spring gardening sales and workshops",
-        "monthly_budget": 2200,
-        "duration_weeks": 8,
-        "competitors": ["Home Depot", "Lowe's"],
-        "is_local": True
-    },
-    {
-        "business_name": "Kids Learning Center",
-        "business_type": "Local Service Business",
-        "location": "Philadelphia, PA",
-        "zip_code": "19101",
-        "miles_radius": 5,
-        "goal": "Fill enrollment for summer and fall programs",
-        "monthly_budget": 3000,
-        "duration_weeks": 10,
-        "competitors": ["KinderCare", "Bright Horizons"],
-        "is_local": True
-    },
-    {
-        "business_name": "Vintage Vinyl Records",
-        "business_type": "Retail Store",
-        "location": "Portland, OR",
-        "zip_code": "97201",
-        "miles_radius": 10,
-        "goal": "Attract collectors and boost online sales",
-        "monthly_budget": 1800,
-        "duration_weeks": 8,
-        "competitors": ["Amazon", "eBay"],
-        "is_local": True
-    },
-    {
-        "business_name": "Elite Personal Training",
-        "business_type": "Fitness Studio",
-        "location": "Dallas, TX",
-        "zip_code": "75201",
-        "miles_radius": 15,
-        "goal": "Sign up 50 new 1-on-1 training clients",
-        "monthly_budget": 2600,
-        "duration_weeks": 12,
-        "competitors": ["LA Fitness", "24 Hour Fitness"],
-        "is_local": True
-    },
-    {
-        "business_name": "Downtown Dental Care",
-        "business_type": "Local Service Business",
-        "location": "Atlanta, GA",
-        "zip_code": "30301",
-        "miles_radius": 10,
-        "goal": "Book consultations for cosmetic dentistry",
-        "monthly_budget": 4500,
-        "duration_weeks": 10,
-        "competitors": ["Aspen Dental", "Comfort Dental"],
-        "is_local": True
-    },
-    {
-        "business_name": "Coastal E-Commerce",
-        "business_type": "E-commerce",
-        "location": "San Diego, CA",
-        "zip_code": "92101",
-        "miles_radius": 50,
-        "goal": "Drive online sales for beachwear collection",
-        "monthly_budget": 5500,
-        "duration_weeks": 8,
-        "competitors": ["Roxy", "Billabong"],
-        "is_local": False
-    },
-    {
-        "business_name": "Gourmet Food Truck",
-        "business_type": "Restaurant",
-        "location": "Washington, DC",
-        "zip_code": "20001",
-        "miles_radius": 5,
-        "goal": "Build social following and event bookings",
-        "monthly_budget": 1500,
-        "duration_weeks": 10,
-        "competitors": ["Other food trucks", "Fast casual restaurants"],
-        "is_local": True
-    },
-    {
-        "business_name": "Smart Home Installer",
-        "business_type": "Local Service Business",
-        "location": "Houston, TX",
-        "zip_code": "77001",
-        "miles_radius": 20,
-        "goal": "Generate leads for smart home installations",
-        "monthly_budget": 3500,
-        "duration_weeks": 12,
-        "competitors": ["Best Buy", "Amazon"],
-        "is_local": True
-    }
+TEST_PROFILES: List[TestProfile] = [
+    TestProfile(
+        business_name="Joe's Coffee Shop",
+        business_type="Coffee Shop",
+        location="San Francisco, CA",
+        zip_code="94107",
+        miles_radius=3,
+        goal="Increase weekday lunchtime traffic by 20%",
+        monthly_budget=2500,
+        duration_weeks=10,
+        competitors=("Starbucks", "Blue Bottle Coffee"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Yoga Flow Studio",
+        business_type="Yoga Studio",
+        location="Portland, OR",
+        zip_code="97201",
+        miles_radius=5,
+        goal="Grow membership by 30% in 3 months",
+        monthly_budget=3500,
+        duration_weeks=12,
+        competitors=("CorePower Yoga", "Modo Yoga"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Bella's Boutique",
+        business_type="Boutique",
+        location="Austin, TX",
+        zip_code="78701",
+        miles_radius=10,
+        goal="Drive online and in-store sales for spring collection",
+        monthly_budget=4000,
+        duration_weeks=8,
+        competitors=("Zara", "Free People"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="TechStart SaaS",
+        business_type="B2B SaaS",
+        location="New York, NY",
+        zip_code="10001",
+        miles_radius=50,
+        goal="Generate 500 qualified leads for enterprise product",
+        monthly_budget=10000,
+        duration_weeks=12,
+        competitors=("Salesforce", "HubSpot"),
+        is_local=False
+    ),
+    TestProfile(
+        business_name="Fitness First Gym",
+        business_type="Fitness Studio",
+        location="Miami, FL",
+        zip_code="33101",
+        miles_radius=7,
+        goal="Increase gym memberships by 25% before summer",
+        monthly_budget=3000,
+        duration_weeks=10,
+        competitors=("Planet Fitness", "Equinox"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="The Local Bakery",
+        business_type="Bakery",
+        location="Seattle, WA",
+        zip_code="98101",
+        miles_radius=4,
+        goal="Boost weekend sales and catering orders",
+        monthly_budget=2000,
+        duration_weeks=8,
+        competitors=("Starbucks", "Whole Foods"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Urban Salon & Spa",
+        business_type="Salon/Spa",
+        location="Los Angeles, CA",
+        zip_code="90001",
+        miles_radius=5,
+        goal="Fill appointment slots and promote new services",
+        monthly_budget=2800,
+        duration_weeks=12,
+        competitors=("Drybar", "Burke Williams"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Prime Real Estate",
+        business_type="Local Service Business",
+        location="Chicago, IL",
+        zip_code="60601",
+        miles_radius=15,
+        goal="Generate seller and buyer leads in luxury market",
+        monthly_budget=5000,
+        duration_weeks=12,
+        competitors=("Compass", "Keller Williams"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Eco Clean Services",
+        business_type="Local Service Business",
+        location="Denver, CO",
+        zip_code="80201",
+        miles_radius=20,
+        goal="Acquire 100 recurring residential cleaning clients",
+        monthly_budget=1500,
+        duration_weeks=8,
+        competitors=("MaidPro", "Molly Maid"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Artisan Pizza Co",
+        business_type="Restaurant",
+        location="Boston, MA",
+        zip_code="02101",
+        miles_radius=3,
+        goal="Increase dinner reservations and delivery orders",
+        monthly_budget=3200,
+        duration_weeks=10,
+        competitors=("Domino's", "Papa Gino's"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Pet Paradise Grooming",
+        business_type="Local Service Business",
+        location="Phoenix, AZ",
+        zip_code="85001",
+        miles_radius=10,
+        goal="Build clientele for new location",
+        monthly_budget=2500,
+        duration_weeks=12,
+        competitors=("PetSmart", "Petco"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="CloudTech Solutions",
+        business_type="B2B SaaS",
+        location="San Jose, CA",
+        zip_code="95101",
+        miles_radius=50,
+        goal="Generate demo requests for cloud migration tool",
+        monthly_budget=8000,
+        duration_weeks=12,
+        competitors=("AWS", "Azure"),
+        is_local=False
+    ),
+    TestProfile(
+        business_name="Green Thumb Nursery",
+        business_type="Retail Store",
+        location="Nashville, TN",
+        zip_code="37201",
+        miles_radius=8,
+        goal="Drive spring gardening sales and workshops",
+        monthly_budget=2200,
+        duration_weeks=8,
+        competitors=("Home Depot", "Lowe's"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Kids Learning Center",
+        business_type="Local Service Business",
+        location="Philadelphia, PA",
+        zip_code="19101",
+        miles_radius=5,
+        goal="Fill enrollment for summer and fall programs",
+        monthly_budget=3000,
+        duration_weeks=10,
+        competitors=("KinderCare", "Bright Horizons"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Vintage Vinyl Records",
+        business_type="Retail Store",
+        location="Portland, OR",
+        zip_code="97201",
+        miles_radius=10,
+        goal="Attract collectors and boost online sales",
+        monthly_budget=1800,
+        duration_weeks=8,
+        competitors=("Amazon", "eBay"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Elite Personal Training",
+        business_type="Fitness Studio",
+        location="Dallas, TX",
+        zip_code="75201",
+        miles_radius=15,
+        goal="Sign up 50 new 1-on-1 training clients",
+        monthly_budget=2600,
+        duration_weeks=12,
+        competitors=("LA Fitness", "24 Hour Fitness"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Downtown Dental Care",
+        business_type="Local Service Business",
+        location="Atlanta, GA",
+        zip_code="30301",
+        miles_radius=10,
+        goal="Book consultations for cosmetic dentistry",
+        monthly_budget=4500,
+        duration_weeks=10,
+        competitors=("Aspen Dental", "Comfort Dental"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Coastal E-Commerce",
+        business_type="E-commerce",
+        location="San Diego, CA",
+        zip_code="92101",
+        miles_radius=50,
+        goal="Drive online sales for beachwear collection",
+        monthly_budget=5500,
+        duration_weeks=8,
+        competitors=("Roxy", "Billabong"),
+        is_local=False
+    ),
+    TestProfile(
+        business_name="Gourmet Food Truck",
+        business_type="Restaurant",
+        location="Washington, DC",
+        zip_code="20001",
+        miles_radius=5,
+        goal="Build social following and event bookings",
+        monthly_budget=1500,
+        duration_weeks=10,
+        competitors=("Other food trucks", "Fast casual restaurants"),
+        is_local=True
+    ),
+    TestProfile(
+        business_name="Smart Home Installer",
+        business_type="Local Service Business",
+        location="Houston, TX",
+        zip_code="77001",
+        miles_radius=20,
+        goal="Generate leads for smart home installations",
+        monthly_budget=3500,
+        duration_weeks=12,
+        competitors=("Best Buy", "Amazon"),
+        is_local=True
+    )
 ]
 
+# Markdown report template, compiled once per process on first use
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent / "app" / "templates")),
+    autoescape=False,
+    auto_reload=False,
+    trim_blocks=True,
+    keep_trailing_newline=True
+)
+_TEMPLATE_ENV.filters['num'] = lambda value, digits=1: f"{value:.{digits}f}"
+_TEMPLATE_ENV.filters['pct'] = lambda value, digits=0: f"{value:.{digits}%}"
+
+AGENT_NAMES = ['rag', 'persona', 'location', 'competitor', 'planner', 'creative', 'performance', 'critic']
+SCORE_METRICS = [
+    'channel_mix_score',
+    'budget_logic_score',
+    'persona_alignment_score',
+    'competitor_differentiation_score',
+    'creative_integration_score',
+    'feasibility_score'
+]
+
+# Validated once at import so a bad profile fails fast instead of mid-run
+TEST_PROFILES_VALIDATED: List[BusinessProfile] = [BusinessProfile(**asdict(p)) for p in TEST_PROFILES]
+
+
+async def _timed(coro, agent_times: Dict[str, float], agent: str):
+    """Await a coroutine and record its duration under agent_times[agent]"""
+    start = time.perf_counter()
+    result = await coro
+    agent_times[agent] = time.perf_counter() - start
+    return result
+
 
 class BenchmarkRunner:
     """Runs benchmark tests and collects metrics"""
 
-    def __init__(self):
-        self.vector_memory = VectorMemory(persist_directory="./vector_store")
+    def __init__(
+        self,
+        profiles: Optional[List[Tuple[int, BusinessProfile]]] = None,
+        results_path: Optional[str] = None
+    ):
+        """
+        Args:
+            profiles: (test_number, profile) pairs to run; defaults to all profiles
+            results_path: JSONL file that per-test results are streamed to
+        """
+        self.profiles = profiles if profiles is not None else list(enumerate(TEST_PROFILES_VALIDATED, 1))
         self.results = []
         self.errors = []
 
-    async def run_single_test(self, profile_data: Dict[str, Any], test_num: int) -> Dict[str, Any]:
-        """Run a single test plan generation"""
-
-        print(f"\n{'='*80}")
-        print(f"  TEST {test_num}/20: {profile_data['business_name']}")
-        print(f"{'='*80}")
+        # Full per-test results are streamed here as each test finishes, so a
+        # crash keeps completed tests; self.results only holds summaries
+        self.results_path = results_path or f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        self._jsonl = None
+
+    def _init_agents(self):
+        """Create the agents used by every test"""
+        # Imported here so CLI-only invocations (--help, --list-profiles,
+        # --aggregate) don't pay for loading the agent stack and ChromaDB
+        from app.agents import (
+            PersonaAgent, LocationAgent, CompetitorAgent,
+            PlannerAgent, CreativeAgent, PerformanceAgent,
+            CriticAgent, RAGAgent
+        )
+        from app.memory.vector_memory import get_vector_memory
+
+        self.vector_memory = get_vector_memory("./vector_store")
+
+        # Agents are stateless between calls (each generate_json uses its own
+        # ADK session), so one set is shared by every test
+        self.rag_agent = RAGAgent(self.vector_memory)
+        self.persona_agent = PersonaAgent()
+        self.location_agent = LocationAgent()
+        self.competitor_agent = CompetitorAgent()
+        self.planner_agent = PlannerAgent()
+        self.creative_agent = CreativeAgent()
+        self.performance_agent = PerformanceAgent()
+        self.critic_agent = CriticAgent()
+
+    def _record_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a full result to the JSONL file and return its summary"""
+        if ORJSON_AVAILABLE:
+            self._jsonl.write(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+        else:
+            self._jsonl.write(json.dumps(result).encode() + b"\n")
+        self._jsonl.flush()
+
+        return self._summarize(result)
+
+    @staticmethod
+    def _summarize(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the fields generate_report needs from a full result"""
+        summary = {
+            key: result[key]
+            for key in ('test_number', 'business_name', 'business_type', 'success',
+                        'total_time', 'agent_times', 'error')
+            if key in result
+        }
+        if 'evaluation' in result:
+            summary['evaluation'] = {
+                metric: result['evaluation'][metric]
+                for metric in ['overall_score', *SCORE_METRICS]
+            }
+        return summary
+
+    def load_detailed_results(self) -> List[Dict[str, Any]]:
+        """Read the full per-test results back from the JSONL file, in test order"""
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        with open(self.results_path, 'rb') as f:
+            results = [loads(line) for line in f if line.strip()]
+        return sorted(results, key=lambda r: r['test_number'])
+
+    async def run_single_test(self, profile: BusinessProfile, test_num: int) -> Dict[str, Any]:
+        """Run a single test plan generation
+
+        Progress lines are collected while the test runs and written in one
+        call at the end, so concurrent tests don't interleave their output.
+        """
+        log_lines: List[str] = []
+        try:
+            return await self._run_single_test(profile, test_num, log_lines.append)
+        finally:
+            sys.stdout.write("\n".join(log_lines) + "\n")
+            sys.stdout.flush()
 
-        profile = BusinessProfile(**profile_data)
+    async def _run_single_test(self, profile: BusinessProfile, test_num: int, log) -> Dict[str, Any]:
+        """Generate one plan, reporting progress through log()"""
 
-        # Initialize agents
-        rag_agent = RAGAgent(self.vector_memory)
-        persona_agent = PersonaAgent()
-        location_agent = LocationAgent()
-        competitor_agent = CompetitorAgent()
-        planner_agent = PlannerAgent()
-        creative_agent = CreativeAgent()
-        performance_agent = PerformanceAgent()
-        critic_agent = CriticAgent()
+        log(f"\n{'='*80}")
+        log(f"  TEST {test_num}/{len(TEST_PROFILES)}: {profile.business_name}")
+        log(f"{'='*80}")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         agent_times = {}
 
         try:
             # Step 0: RAG
-            print("  [1/8] RAGAgent...")
-            rag_start = time.time()
-            rag_augmented = await rag_agent.augment_profile_with_insights(profile.model_dump())
-            agent_times['rag'] = time.time() - rag_start
+            log("  [1/8] RAGAgent...")
+            rag_start = time.perf_counter()
+            rag_augmented = await self.rag_agent.augment_profile_with_insights(profile.model_dump())
+            agent_times['rag'] = time.perf_counter() - rag_start
 
             # Step 1: Personas
-            print("  [2/8] PersonaAgent...")
-            persona_start = time.time()
-            personas = await persona_agent.generate_personas(profile)
-            agent_times['persona'] = time.time() - persona_start
-
-            # Step 2: Location
-            print("  [3/8] LocationAgent...")
-            location_start = time.time()
-            location_analysis = await location_agent.analyze_location(profile)
-            agent_times['location'] = time.time() - location_start
-
-            # Step 3: Competitors
-            print("  [4/8] CompetitorAgent...")
-            competitor_start = time.time()
-            competitor_analysis = await competitor_agent.analyze_competitors(
-                profile.competitors if profile.competitors else ["Generic Competitor"],
-                profile.business_type,
-                profile.location
+            log("  [2/8] PersonaAgent...")
+            persona_start = time.perf_counter()
+            personas = await self.persona_agent.generate_personas(profile)
+            agent_times['persona'] = time.perf_counter() - persona_start
+
+            # Steps 2, 3 and 5: Location, Competitors and Creative don't depend on
+            # each other, so run them concurrently
+            log("  [3/8] LocationAgent | [4/8] CompetitorAgent | [6/8] CreativeAgent...")
+            location_analysis, competitor_analysis, creative_assets = await asyncio.gather(
+                _timed(self.location_agent.analyze_location(profile), agent_times, 'location'),
+                _timed(self.competitor_agent.analyze_competitors(
+                    profile.competitors if profile.competitors else ["Generic Competitor"],
+                    profile.business_type,
+                    profile.location
+                ), agent_times, 'competitor'),
+                _timed(self.creative_agent.generate_assets(profile, personas[0]), agent_times, 'creative')
             )
-            agent_times['competitor'] = time.time() - competitor_start
 
             # Step 4: Planning
-            print("  [5/8] PlannerAgent...")
-            planner_start = time.time()
-            scenarios = await planner_agent.generate_scenarios(profile, personas[0], competitor_analysis)
-            agent_times['planner'] = time.time() - planner_start
-
-            # Step 5: Creative
-            print("  [6/8] CreativeAgent...")
-            creative_start = time.time()
-            creative_assets = await creative_agent.generate_assets(profile, personas[0])
-            agent_times['creative'] = time.time() - creative_start
+            log("  [5/8] PlannerAgent...")
+            planner_start = time.perf_counter()
+            scenarios = await self.planner_agent.generate_scenarios(profile, personas[0], competitor_analysis)
+            agent_times['planner'] = time.perf_counter() - planner_start
 
             # Step 6: Performance
-            print("  [7/8] PerformanceAgent...")
-            performance_start = time.time()
-            performance = await performance_agent.predict_performance(
+            log("  [7/8] PerformanceAgent...")
+            performance_start = time.perf_counter()
+            performance = await self.performance_agent.predict_performance(
                 scenarios, personas[0], profile.business_type, profile.location, profile.is_local
             )
-            agent_times['performance'] = time.time() - performance_start
+            agent_times['performance'] = time.perf_counter() - performance_start
 
             # Step 7: Evaluation
-            print("  [8/8] CriticAgent...")
-            critic_start = time.time()
+            log("  [8/8] CriticAgent...")
+            critic_start = time.perf_counter()
 
+            persona_dumps = [p.model_dump() for p in personas]
             full_plan = {
-                "persona": personas[0].model_dump(),
-                "personas": [p.model_dump() for p in personas],
+                "persona": persona_dumps[0],
+                "personas": persona_dumps,
                 "location_analysis": location_analysis.model_dump(),
                 "competitor_analysis": competitor_analysis.model_dump(),
                 "scenarios": scenarios.model_dump(),
@@ -362,30 +494,30 @@ class BenchmarkRunner:
                 "performance": performance.model_dump()
             }
 
-            evaluation = await critic_agent.evaluate_plan(full_plan)
-            agent_times['critic'] = time.time() - critic_start
+            evaluation = await self.critic_agent.evaluate_plan(full_plan)
+            agent_times['critic'] = time.perf_counter() - critic_start
 
-            total_time = time.time() - start_time
+            total_time = time.perf_counter() - start_time
 
-            print(f"\n  ✓ Success in {total_time:.1f}s")
-            print(f"  Quality Score: {evaluation.overall_score:.0%}")
+            log(f"\n  ✓ Success in {total_time:.1f}s")
+            log(f"  Quality Score: {evaluation.overall_score:.0%}")
 
-            return {
+            return self._record_result({
                 "test_number": test_num,
                 "business_name": profile.business_name,
                 "business_type": profile.business_type,
                 "success": True,
                 "total_time": total_time,
                 "agent_times": agent_times,
-                "evaluation": evaluation.model_dump(),
+                "evaluation": evaluation.model_dump(mode='json'),
                 "timestamp": datetime.now().isoformat()
-            }
+            })
 
         except Exception as e:
-            total_time = time.time() - start_time
-            print(f"\n  ✗ Error: {str(e)}")
+            total_time = time.perf_counter() - start_time
+            log(f"\n  ✗ Error: {str(e)}")
 
-            return {
+            return self._record_result({
                 "test_number": test_num,
                 "business_name": profile.business_name,
                 "business_type": profile.business_type,
@@ -393,28 +525,63 @@ class BenchmarkRunner:
                 "total_time": total_time,
                 "error": str(e),
                 "timestamp": datetime.now().isoformat()
-            }
+            })
 
-    async def run_all_tests(self):
-        """Run all 20 benchmark tests"""
+    async def run_all_tests(self, report: bool = True):
+        """Run the benchmark tests
+
+        Args:
+            report: Generate the JSON/Markdown report once all tests finish
+        """
 
         print("\n" + "="*80)
         print("  SMART AD PLANNER - BENCHMARK SUITE")
-        print("  Running 20 test plans to collect performance metrics")
+        print(f"  Running {len(self.profiles)} test plans to collect performance metrics")
         print("="*80)
 
-        for i, profile_data in enumerate(TEST_PROFILES, 1):
-            result = await self.run_single_test(profile_data, i)
-            self.results.append(result)
+        self._init_agents()
+        # Truncate, so re-running a shard replaces its results instead of duplicating them
+        self._jsonl = open(self.results_path, 'wb')
 
-            if not result['success']:
-                self.errors.append(result)
+        # Tests are I/O bound, so run them concurrently; the semaphore keeps
+        # the number of in-flight plans within LLM rate limits
+        semaphore = asyncio.Semaphore(int(os.getenv("BENCH_CONCURRENCY", "6")))
 
-            # Small delay between tests
-            await asyncio.sleep(1)
+        async def run_bounded(profile: BusinessProfile, test_num: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_single_test(profile, test_num)
 
-        # Generate report
-        self.generate_report()
+        try:
+            results = await asyncio.gather(*[
+                run_bounded(profile, i) for i, profile in self.profiles
+            ])
+        finally:
+            self._jsonl.close()
+
+        self.results = list(results)
+        self.errors = [r for r in self.results if not r['success']]
+
+        if report:
+            self.generate_report()
+        else:
+            print(f"\n💾 Results saved to: {self.results_path}")
+
+    @classmethod
+    def aggregate(cls, shard_paths: List[str]) -> "BenchmarkRunner":
+        """Combine shard JSONL files and report on the union of their results"""
+        runner = cls(results_path=f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
+
+        with open(runner.results_path, 'wb') as out:
+            for path in shard_paths:
+                with open(path, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            out.write(line.rstrip(b"\n") + b"\n")
+
+        runner.results = [cls._summarize(r) for r in runner.load_detailed_results()]
+        runner.errors = [r for r in runner.results if not r['success']]
+        runner.generate_report()
+        return runner
 
     def generate_report(self):
         """Generate benchmark report"""
@@ -433,49 +600,76 @@ class BenchmarkRunner:
             print("\n⚠️ No successful tests - cannot generate metrics")
             return
 
+        agent_names = AGENT_NAMES
+        score_metrics = SCORE_METRICS
+
+        # Pivot the results into arrays once; every statistic below is a
+        # vectorized reduction over these instead of a fresh list per metric
+        n = len(successful)
+        total_arr = np.fromiter((r['total_time'] for r in successful), dtype=np.float64, count=n)
+        scores_arr = np.fromiter((r['evaluation']['overall_score'] for r in successful), dtype=np.float64, count=n)
+        # Fill agent timings in one pass over each result's own timings rather
+        # than probing every result once per agent name
+        agent_index = {agent: col for col, agent in enumerate(agent_names)}
+        agent_arr = np.full((n, len(agent_names)), np.nan)
+        for row, r in enumerate(successful):
+            for agent, elapsed in r['agent_times'].items():
+                col = agent_index.get(agent)
+                if col is not None:
+                    agent_arr[row, col] = elapsed
+        # itemgetter pulls all score metrics out of each evaluation in one C call
+        get_metrics = itemgetter(*score_metrics)
+        metric_arr = np.array(
+            [get_metrics(r['evaluation']) for r in successful],
+            dtype=np.float64
+        )
+
+        time_stats = {
+            "mean": float(total_arr.mean()),
+            "median": float(np.median(total_arr)),
+            "min": float(total_arr.min()),
+            "max": float(total_arr.max()),
+            "stdev": float(total_arr.std(ddof=1)) if n > 1 else 0
+        }
+        score_stats = {
+            "mean": float(scores_arr.mean()),
+            "median": float(np.median(scores_arr)),
+            "min": float(scores_arr.min()),
+            "max": float(scores_arr.max()),
+            "stdev": float(scores_arr.std(ddof=1)) if n > 1 else 0
+        }
+        agent_counts = (~np.isnan(agent_arr)).sum(axis=0)
+        agent_means = np.nansum(agent_arr, axis=0) / np.maximum(agent_counts, 1)
+        metric_means = metric_arr.mean(axis=0)
+
         # Timing stats
-        total_times = [r['total_time'] for r in successful]
         print(f"\n⏱️  Total Time Statistics:")
-        print(f"   Average: {mean(total_times):.1f}s")
-        print(f"   Median: {median(total_times):.1f}s")
-        print(f"   Min: {min(total_times):.1f}s")
-        print(f"   Max: {max(total_times):.1f}s")
-        if len(total_times) > 1:
-            print(f"   Std Dev: {stdev(total_times):.1f}s")
+        print(f"   Average: {time_stats['mean']:.1f}s")
+        print(f"   Median: {time_stats['median']:.1f}s")
+        print(f"   Min: {time_stats['min']:.1f}s")
+        print(f"   Max: {time_stats['max']:.1f}s")
+        if n > 1:
+            print(f"   Std Dev: {time_stats['stdev']:.1f}s")
 
         # Agent-specific timing
         print(f"\n🤖 Average Agent Times:")
-        agent_names = ['rag', 'persona', 'location', 'competitor', 'planner', 'creative', 'performance', 'critic']
-
-        for agent in agent_names:
-            agent_times = [r['agent_times'][agent] for r in successful if agent in r['agent_times']]
-            if agent_times:
-                print(f"   {agent.capitalize()}: {mean(agent_times):.1f}s")
+        for agent, count, avg_time in zip(agent_names, agent_counts, agent_means):
+            if count:
+                print(f"   {agent.capitalize()}: {avg_time:.1f}s")
 
         # Quality scores
-        scores = [r['evaluation']['overall_score'] for r in successful]
         print(f"\n📊 Quality Scores:")
-        print(f"   Average: {mean(scores):.0%}")
-        print(f"   Median: {median(scores):.0%}")
-        print(f"   Min: {min(scores):.0%}")
-        print(f"   Max: {max(scores):.0%}")
-        if len(scores) > 1:
-            print(f"   Std Dev: {stdev(scores):.2%}")
+        print(f"   Average: {score_stats['mean']:.0%}")
+        print(f"   Median: {score_stats['median']:.0%}")
+        print(f"   Min: {score_stats['min']:.0%}")
+        print(f"   Max: {score_stats['max']:.0%}")
+        if n > 1:
+            print(f"   Std Dev: {score_stats['stdev']:.2%}")
 
         # Detailed score breakdown
         print(f"\n📈 Detailed Score Averages:")
-        score_metrics = [
-            'channel_mix_score',
-            'budget_logic_score',
-            'persona_alignment_score',
-            'competitor_differentiation_score',
-            'creative_integration_score',
-            'feasibility_score'
-        ]
-
-        for metric in score_metrics:
-            metric_scores = [r['evaluation'][metric] for r in successful]
-            print(f"   {metric.replace('_', ' ').title()}: {mean(metric_scores):.0%}")
+        for metric, avg_score in zip(score_metrics, metric_means):
+            print(f"   {metric.replace('_', ' ').title()}: {avg_score:.0%}")
 
         # Errors
         if self.errors:
@@ -485,15 +679,13 @@ class BenchmarkRunner:
 
         # Business type performance
         print(f"\n🏢 Performance by Business Type:")
-        business_types = {}
+        business_types = defaultdict(list)
         for r in successful:
-            btype = r['business_type']
-            if btype not in business_types:
-                business_types[btype] = []
-            business_types[btype].append(r['evaluation']['overall_score'])
+            business_types[r['business_type']].append(r['evaluation']['overall_score'])
+        business_type_means = {btype: fmean(btype_scores) for btype, btype_scores in business_types.items()}
 
-        for btype, scores in sorted(business_types.items()):
-            print(f"   {btype}: {mean(scores):.0%} ({len(scores)} tests)")
+        for btype, btype_scores in sorted(business_types.items()):
+            print(f"   {btype}: {business_type_means[btype]:.0%} ({len(btype_scores)} tests)")
 
         # Save results
         report_data = {
@@ -502,52 +694,48 @@ class BenchmarkRunner:
                 "successful_tests": len(successful),
                 "failed_tests": len(self.errors),
                 "success_rate": success_rate,
-                "avg_total_time": mean(total_times),
-                "avg_quality_score": mean(scores),
+                "avg_total_time": time_stats['mean'],
+                "avg_quality_score": score_stats['mean'],
                 "timestamp": datetime.now().isoformat()
             },
             "timing_stats": {
-                "total_time": {
-                    "mean": mean(total_times),
-                    "median": median(total_times),
-                    "min": min(total_times),
-                    "max": max(total_times),
-                    "stdev": stdev(total_times) if len(total_times) > 1 else 0
-                },
+                "total_time": time_stats,
                 "agent_times": {
-                    agent: mean([r['agent_times'][agent] for r in successful if agent in r['agent_times']])
-                    for agent in agent_names
+                    agent: float(avg_time)
+                    for agent, count, avg_time in zip(agent_names, agent_counts, agent_means)
+                    if count
                 }
             },
             "quality_stats": {
-                "overall_score": {
-                    "mean": mean(scores),
-                    "median": median(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                    "stdev": stdev(scores) if len(scores) > 1 else 0
-                },
+                "overall_score": score_stats,
                 "detailed_scores": {
-                    metric: mean([r['evaluation'][metric] for r in successful])
-                    for metric in score_metrics
+                    metric: float(avg_score)
+                    for metric, avg_score in zip(score_metrics, metric_means)
                 }
             },
             "business_type_performance": {
                 btype: {
-                    "avg_score": mean(scores),
-                    "count": len(scores)
+                    "avg_score": business_type_means[btype],
+                    "count": len(btype_scores)
                 }
-                for btype, scores in business_types.items()
+                for btype, btype_scores in business_types.items()
             },
-            "detailed_results": self.results
+            "detailed_results": self.load_detailed_results()
         }
 
         # Save to file
         filename = f"benchmark_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(report_data, f, indent=2)
-
-        print(f"\n💾 Full results saved to: {filename}")
+        if ORJSON_AVAILABLE:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    report_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report_data, f, indent=2)
+
+        print(f"\n💾 Full results saved to: {filename} (per-test stream: {self.results_path})")
 
         # Generate markdown report
         self.generate_markdown_report(report_data)
@@ -559,112 +747,15 @@ class BenchmarkRunner:
     def generate_markdown_report(self, report_data):
         """Generate markdown evaluation report"""
 
-        md_content = f"""# Smart Ad Planner - Benchmark Evaluation Report
-
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Executive Summary
-
-- **Total Tests:** {report_data['summary']['total_tests']}
-- **Success Rate:** {report_data['summary']['success_rate']:.1f}%
-- **Average Generation Time:** {report_data['summary']['avg_total_time']:.1f} seconds
-- **Average Quality Score:** {report_data['summary']['avg_quality_score']:.0%}
-
-## Performance Metrics
-
-### Timing Statistics
+        # max() keeps the first of tied metrics, in SCORE_METRICS order
+        top_metric = max(report_data['quality_stats']['detailed_scores'].items(), key=lambda x: x[1])
 
-| Metric | Value |
-|--------|-------|
-| **Average Total Time** | {report_data['timing_stats']['total_time']['mean']:.1f}s |
-| **Median Time** | {report_data['timing_stats']['total_time']['median']:.1f}s |
-| **Fastest Plan** | {report_data['timing_stats']['total_time']['min']:.1f}s |
-| **Slowest Plan** | {report_data['timing_stats']['total_time']['max']:.1f}s |
-| **Standard Deviation** | {report_data['timing_stats']['total_time']['stdev']:.1f}s |
-
-### Agent Performance
-
-| Agent | Average Time |
-|-------|--------------|
-"""
-
-        for agent, avg_time in report_data['timing_stats']['agent_times'].items():
-            md_content += f"| **{agent.capitalize()}Agent** | {avg_time:.1f}s |\n"
-
-        md_content += f"""
-## Quality Assessment
-
-### Overall Scores
-
-| Metric | Value |
-|--------|-------|
-| **Average Score** | {report_data['quality_stats']['overall_score']['mean']:.0%} |
-| **Median Score** | {report_data['quality_stats']['overall_score']['median']:.0%} |
-| **Highest Score** | {report_data['quality_stats']['overall_score']['max']:.0%} |
-| **Lowest Score** | {report_data['quality_stats']['overall_score']['min']:.0%} |
-| **Standard Deviation** | {report_data['quality_stats']['overall_score']['stdev']:.2%} |
-
-### Detailed Score Breakdown
-
-| Dimension | Average Score |
-|-----------|---------------|
-"""
-
-        for metric, score in report_data['quality_stats']['detailed_scores'].items():
-            display_name = metric.replace('_', ' ').title()
-            md_content += f"| **{display_name}** | {score:.0%} |\n"
-
-        md_content += f"""
-## Business Type Performance
-
-| Business Type | Avg Quality Score | # of Tests |
-|---------------|-------------------|------------|
-"""
-
-        for btype, data in sorted(report_data['business_type_performance'].items()):
-            md_content += f"| {btype} | {data['avg_score']:.0%} | {data['count']} |\n"
-
-        md_content += f"""
-## Key Findings
-
-### ✅ Strengths
-
-1. **High Success Rate:** {report_data['summary']['success_rate']:.0f}% of tests completed successfully
-2. **Fast Generation:** Average time of {report_data['summary']['avg_total_time']:.0f} seconds per plan
-3. **Excellent Quality:** Average quality score of {report_data['summary']['avg_quality_score']:.0%}
-4. **Consistent Performance:** Low standard deviation in both time and quality
-
-### 📊 Performance Insights
-
-- **Fastest Agent:** RAGAgent (~{report_data['timing_stats']['agent_times']['rag']:.1f}s)
-- **Most Time-Intensive Agent:** CreativeAgent (~{report_data['timing_stats']['agent_times']['creative']:.1f}s) due to image generation
-- **Highest Scoring Dimension:** {max(report_data['quality_stats']['detailed_scores'].items(), key=lambda x: x[1])[0].replace('_', ' ').title()} ({max(report_data['quality_stats']['detailed_scores'].values()):.0%})
-- **Most Consistent:** Low variation across all business types
-
-### 🎯 Comparison to Industry Benchmarks
-
-| Metric | Smart Ad Planner | Industry Standard | Improvement |
-|--------|------------------|-------------------|-------------|
-| **Generation Time** | {report_data['summary']['avg_total_time']:.0f}s | 8-12 hours | 96x faster |
-| **Cost per Plan** | $0.63 | $4,500 | 99.986% cheaper |
-| **Quality Score** | {report_data['summary']['avg_quality_score']:.0%} | 76% (junior marketer) | 17% better |
-| **Success Rate** | {report_data['summary']['success_rate']:.0f}% | 85% (human) | {report_data['summary']['success_rate'] - 85:.0f}% better |
-
-## Conclusion
-
-The Smart Ad Planner demonstrates **enterprise-grade performance** with:
-- ✅ {report_data['summary']['success_rate']:.0f}% reliability
-- ✅ Sub-60 second generation times
-- ✅ {report_data['summary']['avg_quality_score']:.0%} average quality scores
-- ✅ Consistent performance across all business types
-
-**Ready for production deployment and Kaggle competition submission.**
-
----
-
-*Generated by Smart Ad Planner Benchmark Suite*
-*Built with Google ADK, Gemini 2.0 Flash, ChromaDB*
-"""
+        template = _TEMPLATE_ENV.get_template("EVALUATION_RESULTS.md.j2")
+        md_content = template.render(
+            report_data=report_data,
+            top_metric=top_metric,
+            generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
 
         # Save markdown report
         md_filename = "EVALUATION_RESULTS.md"
@@ -674,11 +765,66 @@ The Smart Ad Planner demonstrates **enterprise-grade performance** with:
         print(f"📄 Markdown report saved to: {md_filename}")
 
 
-async def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Smart Ad Planner benchmark suite")
+    parser.add_argument(
+        "--list-profiles",
+        action="store_true",
+        help="List the benchmark business profiles and exit"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the profiles across N processes (run one process per shard)"
+    )
+    parser.add_argument(
+        "--shard-id",
+        type=int,
+        default=0,
+        help="Which shard (0..N-1) this process runs"
+    )
+    parser.add_argument(
+        "--aggregate",
+        nargs="*",
+        metavar="JSONL",
+        help="Combine shard result files (default: benchmark_results_shard*.jsonl) and generate the report"
+    )
+    args = parser.parse_args(argv)
+
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if not 0 <= args.shard_id < args.shards:
+        parser.error("--shard-id must be between 0 and --shards - 1")
+
+    return args
+
+
+async def main(shards: int = 1, shard_id: int = 0):
     """Main benchmark runner"""
-    runner = BenchmarkRunner()
-    await runner.run_all_tests()
+    if shards == 1:
+        runner = BenchmarkRunner()
+        await runner.run_all_tests()
+        return
+
+    # Each shard runs every Nth profile and leaves reporting to --aggregate
+    profiles = list(enumerate(TEST_PROFILES_VALIDATED, 1))[shard_id::shards]
+    runner = BenchmarkRunner(profiles, results_path=f"benchmark_results_shard{shard_id}.jsonl")
+    await runner.run_all_tests(report=False)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if args.list_profiles:
+        for i, profile in enumerate(TEST_PROFILES, 1):
+            print(f"{i:2d}. {profile.business_name} ({profile.business_type}, {profile.location})")
+    elif args.aggregate is not None:
+        shard_paths = args.aggregate or sorted(glob.glob("benchmark_results_shard*.jsonl"))
+        if not shard_paths:
+            sys.exit("No shard result files found")
+        BenchmarkRunner.aggregate(shard_paths)
+    elif UVLOOP_AVAILABLE:
+        uvloop.run(main(args.shards, args.shard_id))
+    else:
+        asyncio.run(main(args.shards, args.shard_id))
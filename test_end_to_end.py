@@ -4,12 +4,17 @@ End-to-End Integration Test
 Verifies the complete workflow from profile to evaluation
 """
 # IMPORTANT: Configure SSL certificates BEFORE any other imports
-import os
-import certifi
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+import app._ssl_boot  # noqa: F401
 
 import asyncio
+
+# uvloop is POSIX-only; Windows keeps the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from app.schemas import BusinessProfile
 from app.agents import (
     PersonaAgent, LocationAgent, CompetitorAgent,
@@ -44,21 +49,23 @@ async def test_full_workflow():
         personas = await persona_agent.generate_personas(profile, count=1)
         print(f"✅ Generated persona: {personas[0].name}")
 
-        # Step 2: Location
-        print("\n[2/6] Analyzing location...")
+        # Steps 2, 3 and 5 only need the profile and persona, so run them concurrently
+        print("\n[2/6] Analyzing location, [3/6] competitors, [5/6] creative assets...")
         location_agent = LocationAgent()
-        location_analysis = await location_agent.analyze_location(profile)
-        print(f"✅ Recommended miles: {location_analysis.suggested_miles}")
-
-        # Step 3: Competitors
-        print("\n[3/6] Analyzing competitors...")
         competitor_agent = CompetitorAgent()
-        competitor_analysis = await competitor_agent.analyze_competitors(
-            profile.competitors,
-            profile.business_type,
-            profile.location
+        creative_agent = CreativeAgent()
+        location_analysis, competitor_analysis, creative_assets = await asyncio.gather(
+            location_agent.analyze_location(profile),
+            competitor_agent.analyze_competitors(
+                profile.competitors,
+                profile.business_type,
+                profile.location
+            ),
+            creative_agent.generate_assets(profile, personas[0])
         )
+        print(f"✅ Recommended miles: {location_analysis.suggested_miles}")
         print(f"✅ Analyzed {len(competitor_analysis.competitors)} competitors")
+        print(f"✅ Generated {len(creative_assets.ideas)} creative ideas")
 
         # Step 4: Scenarios
         print("\n[4/6] Generating budget scenarios...")
@@ -68,12 +75,6 @@ async def test_full_workflow():
         )
         print(f"✅ Generated 3 scenarios")
 
-        # Step 5: Creative Assets
-        print("\n[5/6] Generating creative assets...")
-        creative_agent = CreativeAgent()
-        creative_assets = await creative_agent.generate_assets(profile, personas[0])
-        print(f"✅ Generated {len(creative_assets.ideas)} creative ideas")
-
         # Step 6: Performance
         print("\n[6/6] Predicting performance...")
         performance_agent = PerformanceAgent()
@@ -109,5 +110,8 @@ async def test_full_workflow():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_full_workflow())
+    if UVLOOP_AVAILABLE:
+        success = uvloop.run(test_full_workflow())
+    else:
+        success = asyncio.run(test_full_workflow())
     exit(0 if success else 1)
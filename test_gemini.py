@@ -1,4 +1,5 @@
 """Quick test script for Gemini integration"""
+import asyncio
 import os
 import sys
 from dotenv import load_dotenv
@@ -12,6 +13,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 from app.schemas import BusinessProfile
 from app.agents import PersonaAgent
 
+# Fail fast instead of hanging CI on a stuck model call
+PERSONA_TIMEOUT_SECONDS = 30
+
 def test_gemini():
     """Test Gemini API integration"""
 
@@ -44,11 +48,13 @@ def test_gemini():
     # Test PersonaAgent
     print("\n🤖 Testing PersonaAgent with Gemini...")
     try:
-        agent = PersonaAgent(api_key)
+        agent = PersonaAgent()
         print("   ✓ Agent initialized")
 
         print("   Generating persona...")
-        persona = agent.generate_persona(profile)
+        persona = asyncio.run(
+            asyncio.wait_for(agent.generate_persona(profile), timeout=PERSONA_TIMEOUT_SECONDS)
+        )
 
         print("\n✅ SUCCESS! Persona generated:")
         print(f"   Name: {persona.name}")
@@ -4,11 +4,17 @@ Test SSL Fix - Verify that SSL certificates are properly configured
 """
 # IMPORTANT: Configure SSL certificates BEFORE any other imports
 import os
-import certifi
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+import app._ssl_boot  # noqa: F401
 
 import asyncio
+
+# uvloop is POSIX-only; Windows keeps the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from app.schemas import BusinessProfile
 from app.agents import PersonaAgent
 
@@ -47,5 +53,8 @@ async def test_ssl_connection():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_ssl_connection())
+    if UVLOOP_AVAILABLE:
+        success = uvloop.run(test_ssl_connection())
+    else:
+        success = asyncio.run(test_ssl_connection())
     exit(0 if success else 1)
@@ -5,86 +5,105 @@ Simulates the exact flow of the Streamlit app
 """
 # IMPORTANT: Configure SSL certificates BEFORE any other imports
 import os
-import certifi
-os.environ['SSL_CERT_FILE'] = certifi.where()
-os.environ['REQUESTS_CA_BUNDLE'] = certifi.where()
+import app._ssl_boot  # noqa: F401
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
 
 import asyncio
 import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+# uvloop is POSIX-only; Windows keeps the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 from app.schemas import BusinessProfile
 from app.agents import (
-    PersonaAgent, LocationAgent, CompetitorAgent,
+    BaseAgent, PersonaAgent, LocationAgent, CompetitorAgent,
     PlannerAgent, CreativeAgent, PerformanceAgent,
     CriticAgent, RAGAgent
 )
-from app.memory.vector_memory import VectorMemory
+from app.memory.vector_memory import get_vector_memory
+
+@dataclass(slots=True, frozen=True)
+class Agents:
+    """The full set of agents used to generate a plan"""
+    persona: PersonaAgent
+    location: LocationAgent
+    competitor: CompetitorAgent
+    planner: PlannerAgent
+    creative: CreativeAgent
+    performance: PerformanceAgent
+    critic: CriticAgent
+    rag: RAGAgent
+
+
+@lru_cache(maxsize=1)
+def get_agents() -> Agents:
+    """Initialize every agent once per process"""
+    print("Initializing agents...")
+    return Agents(
+        persona=PersonaAgent(),
+        location=LocationAgent(),
+        competitor=CompetitorAgent(),
+        planner=PlannerAgent(),
+        creative=CreativeAgent(),
+        performance=PerformanceAgent(),
+        critic=CriticAgent(),
+        rag=RAGAgent(get_vector_memory())
+    )
+
 
 async def generate_plan_async(profile):
     """Simulate the exact Streamlit generate_plan_async function"""
 
     start_time = time.time()
 
-    # Initialize agents
-    print("Initializing agents...")
-    agents = {
-        'persona': PersonaAgent(),
-        'location': LocationAgent(),
-        'competitor': CompetitorAgent(),
-        'planner': PlannerAgent(),
-        'creative': CreativeAgent(),
-        'performance': PerformanceAgent(),
-        'critic': CriticAgent(),
-        'rag': RAGAgent(VectorMemory())
-    }
-
-    # Step 0: RAG
-    print("\n[0/7] Retrieving historical insights...")
-    rag_augmented = await agents['rag'].augment_profile_with_insights(profile.model_dump())
+    # Agents are built on first use and reused by later calls
+    agents = get_agents()
+
+    # Steps 0-3 only need the profile, so run them concurrently
+    print("\n[0/7] Retrieving historical insights, [1/7] personas, [2/7] location, [3/7] competitors...")
+    rag_augmented, personas, location_analysis, competitor_analysis = await asyncio.gather(
+        agents.rag.augment_profile_with_insights(profile.model_dump()),
+        agents.persona.generate_personas(profile),
+        agents.location.analyze_location(profile),
+        agents.competitor.analyze_competitors(
+            profile.competitors if profile.competitors else ["Generic Competitor"],
+            profile.business_type,
+            profile.location
+        )
+    )
     rag_insights = rag_augmented.get('rag_insights', {})
     print(f"✅ Retrieved RAG insights")
-
-    # Step 1: Personas
-    print("\n[1/7] Generating customer personas...")
-    personas = await agents['persona'].generate_personas(profile)
     print(f"✅ Generated {len(personas)} personas: {[p.name for p in personas]}")
-
-    # Step 2: Location
-    print("\n[2/7] Analyzing location demographics...")
-    location_analysis = await agents['location'].analyze_location(profile)
     print(f"✅ Location analysis complete (suggested: {location_analysis.suggested_miles} miles)")
-
-    # Step 3: Competitors
-    print("\n[3/7] Researching competitors...")
-    competitor_analysis = await agents['competitor'].analyze_competitors(
-        profile.competitors if profile.competitors else ["Generic Competitor"],
-        profile.business_type,
-        profile.location
-    )
     print(f"✅ Analyzed {len(competitor_analysis.competitors)} competitors")
 
-    # Step 4: Budget Scenarios
-    print("\n[4/7] Creating budget scenarios...")
-    scenarios = await agents['planner'].generate_scenarios(
-        profile, personas[0], competitor_analysis
+    # Steps 4-5: creative assets don't depend on the budget scenarios
+    print("\n[4/7] Creating budget scenarios, [5/7] creative assets...")
+    scenarios, creative_assets = await asyncio.gather(
+        agents.planner.generate_scenarios(
+            profile, personas[0], competitor_analysis
+        ),
+        agents.creative.generate_assets(profile, personas[0])
     )
     print(f"✅ Generated 3 budget scenarios")
-
-    # Step 5: Creative Assets
-    print("\n[5/7] Generating creative assets...")
-    creative_assets = await agents['creative'].generate_assets(profile, personas[0])
     print(f"✅ Generated {len(creative_assets.ideas)} creative ideas")
 
     # Step 6: Performance Predictions
     print("\n[6/7] Predicting performance metrics...")
-    performance = await agents['performance'].predict_performance(
+    performance = await agents.performance.predict_performance(
         scenarios, personas[0], profile.business_type, profile.location, profile.is_local
     )
     print(f"✅ Performance predictions complete")
 
     # Step 7: Evaluation
     print("\n[7/7] Evaluating plan quality...")
-    evaluation = await agents['critic'].evaluate_plan(
+    evaluation = await agents.critic.evaluate_plan(
         scenarios=scenarios,
         persona=personas[0],
         competitor_snapshot=competitor_analysis,
@@ -93,28 +112,38 @@ async def generate_plan_async(profile):
     )
     print(f"✅ Plan evaluation complete (score: {evaluation['overall_score']:.2f})")
 
+    # Serialize each result once; full_plan and the return value share the dicts.
+    # _fast_dump copies flat models directly and falls back to model_dump()
+    fast_dump = BaseAgent._fast_dump
+    personas_dump = [fast_dump(p) for p in personas]
+    location_dump = fast_dump(location_analysis)
+    competitor_dump = fast_dump(competitor_analysis)
+    scenarios_dump = fast_dump(scenarios)
+    creative_dump = fast_dump(creative_assets)
+    performance_dump = fast_dump(performance)
+
     # Build full plan for return
     full_plan = {
-        "persona": personas[0].model_dump(),
-        "personas": [p.model_dump() for p in personas],
-        "location_analysis": location_analysis.model_dump(),
-        "competitor_analysis": competitor_analysis.model_dump(),
-        "scenarios": scenarios.model_dump(),
-        "creative_assets": creative_assets.model_dump(),
-        "performance": performance.model_dump()
+        "persona": personas_dump[0],
+        "personas": personas_dump,
+        "location_analysis": location_dump,
+        "competitor_analysis": competitor_dump,
+        "scenarios": scenarios_dump,
+        "creative_assets": creative_dump,
+        "performance": performance_dump
     }
 
     generation_time = time.time() - start_time
 
     return {
-        "profile": profile.model_dump(),
+        "profile": fast_dump(profile),
         "rag_insights": rag_insights,
-        "personas": [p.model_dump() for p in personas],
-        "location_analysis": location_analysis.model_dump(),
-        "competitor_analysis": competitor_analysis.model_dump(),
-        "scenarios": scenarios.model_dump(),
-        "creative_assets": creative_assets.model_dump(),
-        "performance": performance.model_dump(),
+        "personas": personas_dump,
+        "location_analysis": location_dump,
+        "competitor_analysis": competitor_dump,
+        "scenarios": scenarios_dump,
+        "creative_assets": creative_dump,
+        "performance": performance_dump,
         "critic_evaluation": evaluation,  # Already a dict, no .model_dump()
         "generation_time": generation_time
     }
@@ -163,5 +192,8 @@ async def test_streamlit_flow():
         return False
 
 if __name__ == "__main__":
-    success = asyncio.run(test_streamlit_flow())
+    if UVLOOP_AVAILABLE:
+        success = uvloop.run(test_streamlit_flow())
+    else:
+        success = asyncio.run(test_streamlit_flow())
     exit(0 if success else 1)
@@ -0,0 +1,131 @@
+"""Shared pytest fixtures"""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import expect, sync_playwright
+
+STREAMLIT_URL = "http://localhost:8501"
+STREAMLIT_STARTUP_TIMEOUT = 30
+
+# uvloop is POSIX-only; Windows keeps the default asyncio event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group tests by file for --dist=loadgroup
+
+    This keeps the one-worker-per-file behaviour that module-scoped page
+    fixtures rely on. Tests marked serial are deselected by default and run
+    in their own pass with pytest -m serial -n 0.
+    """
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::", 1)[0]))
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole session so async tests share it"""
+    loop = uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def expect_timeout():
+    """Cap how long expect() assertions retry before failing"""
+    expect.set_options(timeout=5000)
+
+
+# RAM-backed on Linux; Chromium's throwaway profile is written here
+TMPFS_DIR = "/dev/shm"
+
+
+@pytest.fixture(scope="session")
+def playwright():
+    """Playwright driver that keeps browser profiles in tmpfs when available
+
+    Overrides pytest-playwright's fixture. The driver creates each browser's
+    temporary user-data-dir under TMPDIR, so pointing it at /dev/shm keeps
+    profile setup off the disk. The override only lasts while the driver starts.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        if os.path.isdir(TMPFS_DIR):
+            mp.setenv("TMPDIR", TMPFS_DIR)
+        pw = sync_playwright().start()
+    yield pw
+    pw.stop()
+
+
+@pytest.fixture(scope="module")
+def module_context(browser, browser_context_args):
+    """Browser context shared by the read-only UI tests of one module
+
+    pytest-playwright already launches one browser per session; this reuses a
+    single context on top of it instead of creating one per test.
+    """
+    context = browser.new_context(**browser_context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="module")
+def module_page(module_context):
+    """Page shared by the read-only UI tests of one module"""
+    page = module_context.new_page()
+    yield page
+    page.close()
+
+
+def _streamlit_healthy() -> bool:
+    """True if a Streamlit server answers its health check"""
+    try:
+        with urllib.request.urlopen(f"{STREAMLIT_URL}/_stcore/health", timeout=1) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope="session")
+def streamlit_server():
+    """Streamlit dashboard that is up and warm before the first UI test
+
+    Reuses a server that is already running; otherwise starts one headless
+    without the file watcher and stops it at the end of the session. Waiting
+    here keeps server startup out of timed tests like test_initial_load_time.
+    """
+    process = None
+    if not _streamlit_healthy():
+        app_path = Path(__file__).resolve().parent.parent / "app_streamlit.py"
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", str(app_path),
+                "--server.headless", "true",
+                "--server.port", "8501",
+                "--server.fileWatcherType", "none",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + STREAMLIT_STARTUP_TIMEOUT
+        while not _streamlit_healthy():
+            if process.poll() is not None or time.monotonic() > deadline:
+                process.kill()
+                pytest.fail("Streamlit server did not start")
+            time.sleep(0.2)
+
+    urllib.request.urlopen(STREAMLIT_URL, timeout=STREAMLIT_STARTUP_TIMEOUT).close()
+    yield STREAMLIT_URL
+
+    if process is not None:
+        process.terminate()
+        process.wait(timeout=10)
@@ -0,0 +1,4 @@
+"""Page objects for the Playwright UI tests"""
+from .dashboard_page import DashboardPage
+
+__all__ = ["DashboardPage"]
@@ -0,0 +1,47 @@
+"""Page object for the Streamlit dashboard"""
+from playwright.sync_api import Locator, Page
+
+
+class DashboardPage:
+    """Dashboard locators, built once per page and reused across assertions"""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+        # Header and sidebar
+        self.header = page.get_by_test_id("app-header")
+        self.business_profile = page.locator("text=Business Profile")
+
+        # Form labels
+        self.business_name_label = page.locator("text=Business Name")
+        self.business_type_label = page.locator("text=Business Type")
+        self.location_label = page.locator("text=Location")
+        self.monthly_budget_label = page.locator("text=Monthly Budget")
+        self.marketing_goal_label = page.locator("text=Marketing Goal")
+
+        # Form inputs
+        self.business_name_input = page.locator("input[aria-label='Business Name *']").first
+        self.location_input = page.locator("input[aria-label='Location *']").first
+        self.goal_textarea = page.locator("textarea[aria-label='Marketing Goal *']").first
+        self.submit_button = page.locator("button:has-text('Generate Marketing Plan')")
+
+        # Header metrics (st.metric renders its label with Streamlit's own test id)
+        self.metric_labels = page.get_by_test_id("stMetricLabel")
+
+        # Footer
+        self.footer = page.get_by_test_id("app-footer")
+        self.github_link = page.get_by_test_id("github-link")
+
+    def load(self, url: str) -> "DashboardPage":
+        """Open the dashboard and wait for the main header"""
+        self.page.goto(url)
+        self.page.wait_for_selector("h1", timeout=10000)
+        return self
+
+    def metric(self, label: str) -> Locator:
+        """Header metric card label, e.g. 'Cost Savings'"""
+        return self.metric_labels.filter(has_text=label)
+
+    def example_button(self, name: str) -> Locator:
+        """Sidebar button that pre-fills the form, e.g. 'Coffee Shop'"""
+        return self.page.locator(f"button:has-text('{name} Example')")
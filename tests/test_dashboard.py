@@ -3,16 +3,44 @@
 Playwright Tests for Streamlit Dashboard
 Tests the interactive UI at http://localhost:8501
 """
+from collections import deque
+
 import pytest
 from playwright.sync_api import Page, expect
-import time
+
+from tests.pages import DashboardPage
+
+
+# Base URL for the Streamlit dashboard
+BASE_URL = "http://localhost:8501"
+
+# Every test needs the dashboard running; conftest starts it if it is not
+pytestmark = pytest.mark.usefixtures("streamlit_server")
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
+def dashboard_storage_state(browser, streamlit_server, tmp_path_factory):
+    """Cookies and local storage captured from one dashboard load
+
+    Contexts start from this state, so Streamlit's first-visit bootstrap is
+    paid once per session instead of once per test.
+    """
+    path = tmp_path_factory.mktemp("dashboard_state") / "state.json"
+    context = browser.new_context()
+    page = context.new_page()
+    page.goto(BASE_URL)
+    page.wait_for_selector("h1", timeout=10000)
+    context.storage_state(path=str(path))
+    context.close()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, dashboard_storage_state):
     """Configure browser context"""
     return {
         **browser_context_args,
+        "storage_state": dashboard_storage_state,
         "viewport": {
             "width": 1920,
             "height": 1080,
@@ -20,142 +48,107 @@ def browser_context_args(browser_context_args):
     }
 
 
+@pytest.fixture(scope="module")
+def dashboard(module_page):
+    """Dashboard loaded once and shared by tests that only read the page"""
+    return DashboardPage(module_page).load(BASE_URL)
+
+
+@pytest.fixture
+def dashboard_page(page):
+    """Page object for tests that interact with their own fresh page"""
+    return DashboardPage(page)
+
+
 class TestDashboardLoading:
     """Test dashboard loads correctly"""
 
-    def test_dashboard_loads(self, page: Page):
+    def test_dashboard_loads(self, page: Page, dashboard_page: DashboardPage):
         """Test that dashboard loads without errors"""
-        page.goto("http://localhost:8501")
+        page.goto(BASE_URL)
 
         # Wait for Streamlit to load
         page.wait_for_selector("h1", timeout=10000)
 
         # Check main header exists
-        expect(page.locator("text=Smart Ad Planner")).to_be_visible()
+        expect(dashboard_page.header).to_be_visible()
+        expect(dashboard_page.header).to_contain_text("Smart Ad Planner")
 
-    def test_sidebar_visible(self, page: Page):
+    def test_sidebar_visible(self, dashboard: DashboardPage):
         """Test sidebar with form is visible"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
         # Check sidebar elements
-        expect(page.locator("text=Business Profile")).to_be_visible()
-        expect(page.locator("text=Business Name")).to_be_visible()
+        expect(dashboard.business_profile).to_be_visible()
+        expect(dashboard.business_name_label).to_be_visible()
 
-    def test_metrics_displayed(self, page: Page):
+    def test_metrics_displayed(self, dashboard: DashboardPage):
         """Test that key metrics are displayed"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
         # Check for metrics
-        expect(page.locator("text=Cost Savings")).to_be_visible()
-        expect(page.locator("text=Time Saved")).to_be_visible()
-        expect(page.locator("text=AI Agents")).to_be_visible()
+        expect(dashboard.metric("Cost Savings")).to_be_visible()
+        expect(dashboard.metric("Time Saved")).to_be_visible()
+        expect(dashboard.metric("AI Agents")).to_be_visible()
 
 
 class TestExampleButtons:
     """Test example profile buttons"""
 
-    def test_coffee_shop_example(self, page: Page):
-        """Test Coffee Shop example button"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
-        # Click Coffee Shop example
-        coffee_button = page.locator("button:has-text('Coffee Shop Example')")
-        expect(coffee_button).to_be_visible()
-        coffee_button.click()
-
-        # Wait for page to reload with example data
-        time.sleep(2)
-
-        # Verify form is pre-filled
-        business_name_input = page.locator("input[aria-label='Business Name *']").first
-        expect(business_name_input).to_have_value("Joe's Coffee Shop")
+    @pytest.mark.parametrize("example,expected_name", [
+        ("Coffee Shop", "Joe's Coffee Shop"),
+        ("Fitness Studio", "Fitness First Gym"),
+        ("Retail Store", "Bella's Boutique"),
+    ])
+    def test_example_button(self, page: Page, dashboard_page: DashboardPage, example, expected_name):
+        """Test example buttons pre-fill the form"""
+        page.goto(BASE_URL)
 
-    def test_fitness_studio_example(self, page: Page):
-        """Test Fitness Studio example button"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        # Click the example (click waits until the button is actionable)
+        dashboard_page.example_button(example).click(timeout=10000)
 
-        # Click Fitness Studio example
-        fitness_button = page.locator("button:has-text('Fitness Studio Example')")
-        expect(fitness_button).to_be_visible()
-        fitness_button.click()
-
-        # Wait for reload
-        time.sleep(2)
-
-        # Verify form is pre-filled
-        business_name_input = page.locator("input[aria-label='Business Name *']").first
-        expect(business_name_input).to_have_value("Fitness First Gym")
-
-    def test_retail_store_example(self, page: Page):
-        """Test Retail Store example button"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
-        # Click Retail Store example
-        retail_button = page.locator("button:has-text('Retail Store Example')")
-        expect(retail_button).to_be_visible()
-        retail_button.click()
-
-        # Wait for reload
-        time.sleep(2)
-
-        # Verify form is pre-filled
-        business_name_input = page.locator("input[aria-label='Business Name *']").first
-        expect(business_name_input).to_have_value("Bella's Boutique")
+        # Verify form is pre-filled (expect retries until Streamlit reruns)
+        expect(dashboard_page.business_name_input).to_have_value(expected_name)
 
 
 class TestFormInputs:
     """Test form input fields"""
 
-    def test_business_name_input(self, page: Page):
+    def test_business_name_input(self, page: Page, dashboard_page: DashboardPage):
         """Test business name can be entered"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        business_name = dashboard_page.business_name_input
+        page.goto(BASE_URL)
+        business_name.wait_for(state="visible", timeout=10000)
 
-        # Find and fill business name
-        business_name = page.locator("input[aria-label='Business Name *']").first
+        # Fill business name
         business_name.fill("Test Business")
 
         expect(business_name).to_have_value("Test Business")
 
-    def test_business_type_selector(self, page: Page):
+    def test_business_type_selector(self, dashboard: DashboardPage):
         """Test business type dropdown"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
         # Check business type selector exists
-        expect(page.locator("text=Business Type")).to_be_visible()
+        expect(dashboard.business_type_label).to_be_visible()
 
-    def test_location_input(self, page: Page):
+    def test_location_input(self, page: Page, dashboard_page: DashboardPage):
         """Test location input"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        location = dashboard_page.location_input
+        page.goto(BASE_URL)
+        location.wait_for(state="visible", timeout=10000)
 
-        # Find and fill location
-        location = page.locator("input[aria-label='Location *']").first
+        # Fill location
         location.fill("New York, NY")
 
         expect(location).to_have_value("New York, NY")
 
-    def test_budget_input(self, page: Page):
+    def test_budget_input(self, dashboard: DashboardPage):
         """Test monthly budget number input"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
         # Budget input should be visible
-        expect(page.locator("text=Monthly Budget")).to_be_visible()
+        expect(dashboard.monthly_budget_label).to_be_visible()
 
-    def test_goal_textarea(self, page: Page):
+    def test_goal_textarea(self, page: Page, dashboard_page: DashboardPage):
         """Test marketing goal textarea"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        goal = dashboard_page.goal_textarea
+        page.goto(BASE_URL)
+        goal.wait_for(state="visible", timeout=10000)
 
-        # Find and fill goal
-        goal = page.locator("textarea[aria-label='Marketing Goal *']").first
+        # Fill goal
         goal.fill("Increase brand awareness by 50%")
 
         expect(goal).to_have_value("Increase brand awareness by 50%")
@@ -164,18 +157,15 @@ class TestFormInputs:
 class TestFormValidation:
     """Test form validation"""
 
-    def test_submit_empty_form(self, page: Page):
+    def test_submit_empty_form(self, page: Page, dashboard_page: DashboardPage):
         """Test submitting empty form shows validation error"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        submit_button = dashboard_page.submit_button
+        page.goto(BASE_URL)
 
         # Try to submit without filling required fields
-        submit_button = page.locator("button:has-text('Generate Marketing Plan')")
-        expect(submit_button).to_be_visible()
-        submit_button.click()
+        submit_button.click(timeout=10000)
 
         # Should show error message
-        time.sleep(1)
         # Note: Exact error message depends on Streamlit implementation
         # We just verify button is still there (no navigation happened)
         expect(submit_button).to_be_visible()
@@ -184,104 +174,90 @@ class TestFormValidation:
 class TestWelcomeScreen:
     """Test welcome screen content"""
 
-    def test_how_it_works_section(self, page: Page):
+    def test_how_it_works_section(self, dashboard: DashboardPage):
         """Test How It Works section"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        expect(dashboard.page.locator("text=How It Works")).to_be_visible()
+        expect(dashboard.page.locator("text=Fill in your business profile")).to_be_visible()
 
-        expect(page.locator("text=How It Works")).to_be_visible()
-        expect(page.locator("text=Fill in your business profile")).to_be_visible()
-
-    def test_ai_agents_section(self, page: Page):
+    def test_ai_agents_section(self, dashboard: DashboardPage):
         """Test 7 AI Agents section"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
-        expect(page.locator("text=7 AI Agents")).to_be_visible()
-        expect(page.locator("text=RAG Agent")).to_be_visible()
-        expect(page.locator("text=Persona Agent")).to_be_visible()
-        expect(page.locator("text=Location Agent")).to_be_visible()
-        expect(page.locator("text=Competitor Agent")).to_be_visible()
+        expect(dashboard.page.locator("text=7 AI Agents")).to_be_visible()
+        expect(dashboard.page.locator("text=RAG Agent")).to_be_visible()
+        expect(dashboard.page.locator("text=Persona Agent")).to_be_visible()
+        expect(dashboard.page.locator("text=Location Agent")).to_be_visible()
+        expect(dashboard.page.locator("text=Competitor Agent")).to_be_visible()
 
-    def test_benefits_section(self, page: Page):
+    def test_benefits_section(self, dashboard: DashboardPage):
         """Test Benefits section"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
-        expect(page.locator("text=Benefits")).to_be_visible()
-        expect(page.locator("text=99.98% cheaper")).to_be_visible()
-        expect(page.locator("text=96x faster")).to_be_visible()
+        expect(dashboard.page.locator("text=Benefits")).to_be_visible()
+        expect(dashboard.page.locator("text=99.98% cheaper")).to_be_visible()
+        expect(dashboard.page.locator("text=96x faster")).to_be_visible()
 
 
 class TestResponsiveness:
     """Test responsive design"""
 
-    def test_mobile_viewport(self, page: Page):
-        """Test dashboard on mobile viewport"""
-        page.set_viewport_size({"width": 375, "height": 812})
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+    def test_responsive_dashboard(self, page: Page, dashboard_page: DashboardPage):
+        """Test dashboard on desktop, tablet and mobile viewports"""
+        page.goto(BASE_URL)
+        dashboard_page.header.wait_for(state="visible", timeout=10000)
 
-        # Main header should still be visible
-        expect(page.locator("text=Smart Ad Planner")).to_be_visible()
+        # Resizing re-lays out the loaded page; no reload needed
+        for width, height in [(1920, 1080), (768, 1024), (375, 812)]:
+            page.set_viewport_size({"width": width, "height": height})
 
-    def test_tablet_viewport(self, page: Page):
-        """Test dashboard on tablet viewport"""
-        page.set_viewport_size({"width": 768, "height": 1024})
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+            # Main header should still be visible
+            expect(dashboard_page.header).to_be_visible()
 
-        # Check content is accessible
-        expect(page.locator("text=Business Profile")).to_be_visible()
+            # Sidebar form stays accessible down to tablet width
+            if width >= 768:
+                expect(dashboard_page.business_profile).to_be_visible()
 
 
 class TestAccessibility:
     """Test accessibility features"""
 
-    def test_page_title(self, page: Page):
+    def test_page_title(self, dashboard: DashboardPage):
         """Test page has proper title"""
-        page.goto("http://localhost:8501")
-        expect(page).to_have_title("Smart Ad Planner - AI Marketing Plans")
+        expect(dashboard.page).to_have_title("Smart Ad Planner - AI Marketing Plans")
 
-    def test_form_labels(self, page: Page):
+    def test_form_labels(self, dashboard: DashboardPage):
         """Test form inputs have labels"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
-
         # Check key labels exist
-        expect(page.locator("text=Business Name")).to_be_visible()
-        expect(page.locator("text=Business Type")).to_be_visible()
-        expect(page.locator("text=Location")).to_be_visible()
-        expect(page.locator("text=Marketing Goal")).to_be_visible()
+        expect(dashboard.business_name_label).to_be_visible()
+        expect(dashboard.business_type_label).to_be_visible()
+        expect(dashboard.location_label).to_be_visible()
+        expect(dashboard.marketing_goal_label).to_be_visible()
 
 
 class TestFooter:
     """Test footer content"""
 
-    def test_footer_visible(self, page: Page):
+    def test_footer_visible(self, page: Page, dashboard_page: DashboardPage):
         """Test footer is visible"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        page.goto(BASE_URL)
+        page.wait_for_selector("h1", state="visible", timeout=10000)
 
-        # Scroll to bottom
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1)
+        # Scroll the footer into view (waits for it to render)
+        footer = dashboard_page.footer
+        footer.scroll_into_view_if_needed()
 
         # Check footer text
-        expect(page.locator("text=Built with")).to_be_visible()
-        expect(page.locator("text=Google ADK")).to_be_visible()
+        expect(footer).to_be_visible()
+        expect(footer).to_contain_text("Built with")
+        expect(footer).to_contain_text("Google ADK")
 
-    def test_github_link(self, page: Page):
+    def test_github_link(self, page: Page, dashboard_page: DashboardPage):
         """Test GitHub link in footer"""
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        page.goto(BASE_URL)
+        page.wait_for_selector("h1", state="visible", timeout=10000)
 
-        # Scroll to bottom
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1)
+        # Scroll the link into view (waits for it to render)
+        github_link = dashboard_page.github_link
+        github_link.scroll_into_view_if_needed()
 
         # Check GitHub link exists
-        expect(page.locator("a:has-text('GitHub')")).to_be_visible()
+        expect(github_link).to_be_visible()
 
 
 # Performance Tests
@@ -290,29 +266,48 @@ class TestPerformance:
 
     def test_initial_load_time(self, page: Page):
         """Test page loads within acceptable time"""
-        start_time = time.time()
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("domcontentloaded")
-        load_time = time.time() - start_time
+        page.goto(BASE_URL)
+        page.wait_for_selector("h1")
+
+        # Browser-side Navigation Timing, free of Playwright RPC latency
+        nav = page.evaluate("() => performance.getEntriesByType('navigation')[0].toJSON()")
+        dom_content_loaded = nav["domContentLoadedEventEnd"] - nav["startTime"]
+
+        # Should reach DOMContentLoaded in under 2 seconds
+        assert dom_content_loaded < 2000, f"DOMContentLoaded took {dom_content_loaded:.0f}ms"
+
+    def test_first_contentful_paint(self, page: Page):
+        """Test first content is painted within acceptable time"""
+        page.goto(BASE_URL)
+        page.wait_for_selector("h1")
+
+        # The header is rendered by now, so the paint entry is already recorded
+        fcp = page.evaluate("""() => {
+            const entry = performance.getEntriesByName('first-contentful-paint')[0];
+            return entry ? entry.startTime : null;
+        }""")
+        assert fcp is not None, "No first-contentful-paint entry recorded"
 
-        # Should load in under 5 seconds
-        assert load_time < 5.0, f"Page took {load_time:.2f}s to load"
+        # Should paint first content in under 3 seconds
+        assert fcp < 3000, f"First contentful paint took {fcp:.0f}ms"
 
     def test_no_console_errors(self, page: Page):
         """Test page has no console errors"""
-        errors = []
+        # Filter in the handler (known Streamlit warnings are skipped) and
+        # keep only the most recent errors
+        errors = deque(maxlen=32)
 
-        page.on("console", lambda msg:
-            errors.append(msg.text) if msg.type == "error" else None
-        )
+        def on_console(msg):
+            if msg.type == "error" and "streamlit" not in msg.text.lower():
+                errors.append(msg.text)
 
-        page.goto("http://localhost:8501")
-        page.wait_for_load_state("networkidle")
+        page.on("console", on_console)
 
-        # Filter out known Streamlit warnings
-        critical_errors = [e for e in errors if "streamlit" not in e.lower()]
+        page.goto(BASE_URL)
+        # The footer renders last, so the whole script has run by then
+        page.get_by_test_id("app-footer").wait_for(state="attached", timeout=10000)
 
-        assert len(critical_errors) == 0, f"Console errors found: {critical_errors}"
+        assert not errors, f"Console errors found: {list(errors)}"
 
 
 if __name__ == "__main__":
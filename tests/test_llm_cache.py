@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for the LLM response cache
+"""
+import sqlite3
+import time
+from contextlib import closing
+
+import pytest
+from app.memory import LLMCache
+
+
+@pytest.fixture
+def llm_cache(tmp_path):
+    """Fresh cache backed by a temporary database"""
+    return LLMCache(db_path=str(tmp_path / "llm_cache.db"), ttl_days=1)
+
+
+class TestLLMCache:
+    """Test LLMCache behaviour"""
+
+    def test_miss_returns_none(self, llm_cache):
+        """Test unknown keys are a miss"""
+        key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "prompt")
+        assert llm_cache.get(key) is None
+
+    def test_hit_returns_stored_response(self, llm_cache):
+        """Test a stored response is returned for the same key"""
+        key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "prompt")
+        response = {"name": "Test Persona", "interests": ["coffee"]}
+
+        llm_cache.set(key, response)
+
+        assert llm_cache.get(key) == response
+
+    def test_expired_entry_is_a_miss(self, llm_cache):
+        """Test entries older than the TTL are not returned"""
+        key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "prompt")
+        llm_cache.set(key, {"name": "Test Persona"})
+
+        # Age the entry past the one-day TTL
+        with closing(sqlite3.connect(llm_cache.db_path)) as conn, conn:
+            conn.execute(
+                "UPDATE llm_cache SET created_at = ? WHERE key = ?",
+                (time.time() - 2 * 86400, key)
+            )
+
+        assert llm_cache.get(key) is None
+
+    def test_make_key_normalizes_whitespace(self):
+        """Test prompts differing only in whitespace share a key"""
+        key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "Generate  a\n persona ")
+        same_key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "Generate a persona")
+
+        assert key == same_key
+
+    def test_make_key_includes_request_parameters(self):
+        """Test model, temperature and agent are part of the key"""
+        key = LLMCache.make_key("gemini-2.0-flash", 0.7, "persona_agent", "prompt")
+
+        assert key != LLMCache.make_key("gemini-1.5-pro", 0.7, "persona_agent", "prompt")
+        assert key != LLMCache.make_key("gemini-2.0-flash", 0.2, "persona_agent", "prompt")
+        assert key != LLMCache.make_key("gemini-2.0-flash", 0.7, "critic_agent", "prompt")
@@ -23,39 +23,42 @@ def browser_context_args(browser_context_args):
     }
 
 
+@pytest.fixture(scope="module")
+def homepage(module_page):
+    """Homepage loaded once and shared by tests that only read the page"""
+    module_page.goto(BASE_URL)
+    return module_page
+
+
 class TestSmartAdPlannerUI:
     """UI tests for Smart Ad Planner"""
 
-    def test_homepage_loads(self, page: Page):
+    def test_homepage_loads(self, homepage: Page):
         """Test that the homepage loads correctly"""
-        page.goto(BASE_URL)
-
         # Check title
-        expect(page).to_have_title("Smart Ad Planner - Create Your Marketing Plan")
+        expect(homepage).to_have_title("Smart Ad Planner - Create Your Marketing Plan")
 
         # Check header
-        expect(page.locator("h1")).to_contain_text("AI-Powered Small Business Ad Planner")
-        expect(page.locator("h3")).to_contain_text("by Amit Dar")
+        expect(homepage.locator("h1")).to_contain_text("AI-Powered Small Business Ad Planner")
+        expect(homepage.locator("h3")).to_contain_text("by Amit Dar")
 
-    def test_form_elements_present(self, page: Page):
+    def test_form_elements_present(self, homepage: Page):
         """Test that all form elements are present"""
-        page.goto(BASE_URL)
-
         # Check business information fields
-        expect(page.locator("#business_name")).to_be_visible()
-        expect(page.locator("#business_type")).to_be_visible()
-        expect(page.locator("#zip_code")).to_be_visible()
-        expect(page.locator("#miles_radius")).to_be_visible()
+        expect(homepage.locator("#business_name")).to_be_visible()
+        expect(homepage.locator("#business_type")).to_be_visible()
+        expect(homepage.locator("#zip_code")).to_be_visible()
+        expect(homepage.locator("#miles_radius")).to_be_visible()
 
         # Check goal field
-        expect(page.locator("#goal")).to_be_visible()
+        expect(homepage.locator("#goal")).to_be_visible()
 
         # Check budget field
-        expect(page.locator("#monthly_budget")).to_be_visible()
-        expect(page.locator("#duration_weeks")).to_be_visible()
+        expect(homepage.locator("#monthly_budget")).to_be_visible()
+        expect(homepage.locator("#duration_weeks")).to_be_visible()
 
         # Check submit button
-        expect(page.locator('button[type="submit"]')).to_be_visible()
+        expect(homepage.locator('button[type="submit"]')).to_be_visible()
 
     def test_form_validation(self, page: Page):
         """Test form validation"""
@@ -103,21 +106,17 @@ class TestSmartAdPlannerUI:
         # Verify value
         expect(page.locator("#competitors")).to_have_value("Competitor 1, Competitor 2, Competitor 3")
 
-    def test_response_sections_exist(self, page: Page):
+    def test_response_sections_exist(self, homepage: Page):
         """Test that response sections exist in the DOM"""
-        page.goto(BASE_URL)
-
         # Check for results container
-        expect(page.locator("#result")).to_be_attached()
+        expect(homepage.locator("#result")).to_be_attached()
 
-    def test_navigation_elements(self, page: Page):
+    def test_navigation_elements(self, homepage: Page):
         """Test navigation and UI elements"""
-        page.goto(BASE_URL)
-
         # Check form sections
-        expect(page.locator("text=Business Information")).to_be_visible()
-        expect(page.locator("text=Budget & Timeline")).to_be_visible()
-        expect(page.locator("text=Competitive Landscape")).to_be_visible()
+        expect(homepage.get_by_test_id("section-business-info")).to_be_visible()
+        expect(homepage.get_by_test_id("section-budget-timeline")).to_be_visible()
+        expect(homepage.get_by_test_id("section-competitors")).to_be_visible()
 
     def test_responsive_layout(self, page: Page):
         """Test responsive layout on different viewport sizes"""
@@ -134,23 +133,22 @@ class TestSmartAdPlannerUI:
         page.set_viewport_size({"width": 375, "height": 667})
         expect(page.locator("h1")).to_be_visible()
 
-    def test_form_accessibility(self, page: Page):
+    def test_form_accessibility(self, homepage: Page):
         """Test basic accessibility features"""
-        page.goto(BASE_URL)
-
         # Check for labels associated with inputs
-        expect(page.locator('label[for="business_name"]')).to_be_visible()
-        expect(page.locator('label[for="monthly_budget"]')).to_be_visible()
+        expect(homepage.locator('label[for="business_name"]')).to_be_visible()
+        expect(homepage.locator('label[for="monthly_budget"]')).to_be_visible()
 
         # Check for required fields
-        expect(page.locator("#business_name")).to_have_attribute("required", "")
-        expect(page.locator("#business_type")).to_have_attribute("required", "")
+        expect(homepage.locator("#business_name")).to_have_attribute("required", "")
+        expect(homepage.locator("#business_type")).to_have_attribute("required", "")
 
 
 class TestEndToEndWorkflow:
     """End-to-end workflow tests"""
 
     @pytest.mark.slow
+    @pytest.mark.serial
     def test_complete_form_submission(self, page: Page):
         """Test complete form submission workflow (this will take time due to AI processing)"""
         page.goto(BASE_URL)
@@ -5,96 +5,123 @@ Run: python3 view_db.py
 """
 import sqlite3
 import json
+import sys
+from contextlib import closing
 from datetime import datetime
 
-db_path = "ad_planner.db"
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-
-print("=" * 80)
-print("DATABASE SUMMARY")
-print("=" * 80)
-
-# Count records
-cursor.execute("SELECT COUNT(*) FROM users")
-total_users = cursor.fetchone()[0]
-
-cursor.execute("SELECT COUNT(*) FROM plans")
-total_plans = cursor.fetchone()[0]
-
-cursor.execute("SELECT COUNT(*) FROM feedback")
-total_feedback = cursor.fetchone()[0]
-
-print(f"Total Users: {total_users}")
-print(f"Total Plans: {total_plans}")
-print(f"Total Feedback: {total_feedback}")
-
-print("\n" + "=" * 80)
-print("RECENT PLANS (Last 5)")
-print("=" * 80)
-
-cursor.execute("""
-    SELECT p.id, u.session_id, p.created_at
-    FROM plans p
-    JOIN users u ON p.user_id = u.id
-    ORDER BY p.created_at DESC
-    LIMIT 5
-""")
-
-for row in cursor.fetchall():
-    plan_id = row[0]
-    session_id = row[1][:16] + "..." if len(row[1]) > 16 else row[1]
-    created_at = row[2]
-    print(f"Plan ID: {plan_id:2d} | Session: {session_id:20s} | Created: {created_at}")
-
-print("\n" + "=" * 80)
-print("FEEDBACK STATS")
-print("=" * 80)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-cursor.execute("""
-    SELECT plan_type, AVG(rating) as avg_rating, COUNT(*) as count
-    FROM feedback
-    GROUP BY plan_type
-""")
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
-feedback_rows = cursor.fetchall()
-if feedback_rows:
-    for row in feedback_rows:
-        print(f"{row[0]}: {row[1]:.2f} stars ({row[2]} ratings)")
-else:
-    print("No feedback yet")
+db_path = "ad_planner.db"
 
-print("\n" + "=" * 80)
-print("SAMPLE PLAN DATA")
-print("=" * 80)
+# Databases created before these indexes were added to db/init.sql lack them;
+# with them the ORDER BY ... LIMIT queries walk idx_plans_created_at instead
+# of sorting the whole plans table. This is the only write, on its own connection.
+with closing(sqlite3.connect(db_path)) as conn:
+    conn.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_plans_created_at ON plans(created_at);
+        CREATE INDEX IF NOT EXISTS idx_plans_user_id ON plans(user_id);
+        CREATE INDEX IF NOT EXISTS idx_feedback_plan_type ON feedback(plan_type, rating);
+    """)
+
+# Summary, recent plans and feedback stats are formatted by SQLite's printf;
+# Python only writes the finished lines. Sort keys keep the sections in order.
+REPORT_SQL = """
+    WITH recent_plans AS (
+        SELECT
+            row_number() OVER (ORDER BY p.created_at DESC) AS seq,
+            printf(
+                'Plan ID: %2d | Session: %-20s | Created: %s',
+                p.id,
+                CASE WHEN length(u.session_id) > 16
+                     THEN substr(u.session_id, 1, 16) || '...'
+                     ELSE u.session_id END,
+                p.created_at
+            ) AS line
+        FROM plans p
+        JOIN users u ON p.user_id = u.id
+        ORDER BY p.created_at DESC
+        LIMIT 5
+    ),
+    feedback_stats AS (
+        SELECT
+            row_number() OVER (ORDER BY plan_type) AS seq,
+            printf('%s: %.2f stars (%d ratings)', plan_type, AVG(rating), COUNT(*)) AS line
+        FROM feedback
+        GROUP BY plan_type
+    ),
+    report(section, seq, line) AS (
+        SELECT 0, 0, :rule
+        UNION ALL SELECT 0, 1, 'DATABASE SUMMARY'
+        UNION ALL SELECT 0, 2, :rule
+        UNION ALL SELECT 0, 3, 'Total Users: ' || (SELECT COUNT(*) FROM users)
+        UNION ALL SELECT 0, 4, 'Total Plans: ' || (SELECT COUNT(*) FROM plans)
+        UNION ALL SELECT 0, 5, 'Total Feedback: ' || (SELECT COUNT(*) FROM feedback)
+
+        UNION ALL SELECT 1, -3, ''
+        UNION ALL SELECT 1, -2, :rule
+        UNION ALL SELECT 1, -1, 'RECENT PLANS (Last 5)'
+        UNION ALL SELECT 1, 0, :rule
+        UNION ALL SELECT 1, seq, line FROM recent_plans
+
+        UNION ALL SELECT 2, -3, ''
+        UNION ALL SELECT 2, -2, :rule
+        UNION ALL SELECT 2, -1, 'FEEDBACK STATS'
+        UNION ALL SELECT 2, 0, :rule
+        UNION ALL SELECT 2, seq, line FROM feedback_stats
+        UNION ALL SELECT 2, 1, 'No feedback yet' WHERE NOT EXISTS (SELECT 1 FROM feedback)
+    )
+    SELECT line FROM report ORDER BY section, seq
+"""
 
-cursor.execute("""
-    SELECT profile_json, plan_json
-    FROM plans
-    ORDER BY created_at DESC
-    LIMIT 1
-""")
-
-result = cursor.fetchone()
-if result:
-    profile = json.loads(result[0])
-    plan = json.loads(result[1])
-
-    print(f"Business Name: {profile.get('business_name')}")
-    print(f"Business Type: {profile.get('business_type')}")
-    print(f"Location: {profile.get('zip_code', profile.get('location'))}")
-    print(f"Budget: ${profile.get('monthly_budget'):,.0f}")
-    print(f"Goal: {profile.get('goal')[:100]}...")
-
-    if 'persona' in plan:
-        print(f"\nPersona: {plan['persona'].get('name')}")
-
-    if 'critic_evaluation' in plan:
-        print(f"Critic Score: {plan['critic_evaluation'].get('overall_score', 'N/A')}")
-else:
-    print("No plans found")
-
-conn.close()
+# The report itself runs on a read-only connection (mode=ro), closed even on error
+with closing(sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)) as conn:
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        PRAGMA query_only = ON;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA mmap_size = 268435456;
+    """)
+    cursor = conn.cursor()
+
+    report_rows = cursor.execute(REPORT_SQL, {"rule": "=" * 80}).fetchall()
+    sys.stdout.write("\n".join(row['line'] for row in report_rows) + "\n")
+
+    print("\n" + "=" * 80)
+    print("SAMPLE PLAN DATA")
+    print("=" * 80)
+
+    # Fetched as BLOBs so the JSON parser gets raw UTF-8 bytes without a str decode
+    cursor.execute("""
+        SELECT CAST(profile_json AS BLOB) AS profile_json, CAST(plan_json AS BLOB) AS plan_json
+        FROM plans
+        ORDER BY created_at DESC
+        LIMIT 1
+    """)
+
+    result = cursor.fetchone()
+    if result:
+        profile = _json_loads(result['profile_json'])
+        plan = _json_loads(result['plan_json'])
+
+        print(f"Business Name: {profile.get('business_name')}")
+        print(f"Business Type: {profile.get('business_type')}")
+        print(f"Location: {profile.get('zip_code', profile.get('location'))}")
+        print(f"Budget: ${profile.get('monthly_budget'):,.0f}")
+        print(f"Goal: {profile.get('goal')[:100]}...")
+
+        if 'persona' in plan:
+            print(f"\nPersona: {plan['persona'].get('name')}")
+
+        if 'critic_evaluation' in plan:
+            print(f"Critic Score: {plan['critic_evaluation'].get('overall_score', 'N/A')}")
+    else:
+        print("No plans found")
 
 print("\n" + "=" * 80)
 print("To explore further, run: sqlite3 ad_planner.db")